@@ -8,10 +8,24 @@ import io
 import base64
 import time
 import psycopg2
+import threading
 from tkinter import messagebox
 import numpy as np
 
 
+class QueryError(Exception):
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+
+def report_query_error(title, message):
+    # Tk is not thread-safe, so queries run on a worker hand the error back for the Tk thread to show
+    if threading.current_thread() is not threading.main_thread():
+        raise QueryError(title, message)
+    messagebox.showerror(title, message)
+
+
 class BaseAnalytics:
 
     def __init__(self):
@@ -41,12 +55,12 @@ class BaseAnalytics:
                 else:
                     print("Max retries reached. Showing error to user.")
                     error_msg = f"Database connection failed after {max_retries} attempts.\n\nError: {str(e)}\n\nPlease check your internet connection and try again."
-                    messagebox.showerror("Database Connection Error", error_msg)
+                    report_query_error("Database Connection Error", error_msg)
 
             except Exception as e:
                 print(f"Unexpected error: {e}")
                 error_msg = f"An unexpected error occurred while executing the query:\n\n{str(e)}"
-                messagebox.showerror("Query Error", error_msg)
+                report_query_error("Query Error", error_msg)
                 break
 
         return pd.DataFrame()
@@ -1273,7 +1287,10 @@ class RestockerAnalytics(BaseAnalytics):
             p.current_stock ASC
         """
 
-        return self.execute_query(query)
+        df = self.execute_query(query)
+        if not df.empty:
+            df['stock_status'] = pd.Categorical(df['stock_status'], categories=['Out of Stock', 'Critical', 'Low', 'Normal'], ordered=True)
+        return df
 
     def get_predicted_high_demand_products(self, days=30):
         query = """
@@ -1326,7 +1343,10 @@ class RestockerAnalytics(BaseAnalytics):
 
         week_ago = datetime.now() - timedelta(days=7)
         month_ago = datetime.now() - timedelta(days=days)
-        return self.execute_query(query, [week_ago, month_ago, month_ago])
+        df = self.execute_query(query, [week_ago, month_ago, month_ago])
+        if not df.empty:
+            df['demand_risk'] = pd.Categorical(df['demand_risk'], categories=['High Demand Risk', 'Medium Demand Risk', 'Low Demand Risk'], ordered=True)
+        return df
 
     def get_inventory_movement_trends(self, days=30):
         query = """
@@ -2,18 +2,27 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 import pandas as pd
 import numpy as np
-from analytics_engine import ManagerAnalytics
-from report_generator import ManagerReportGenerator
+from analytics_engine import ManagerAnalytics, QueryError
 import seaborn as sns
 from tkcalendar import DateEntry
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from utils import downsample_lttb
 
 plt.style.use('seaborn-v0_8')
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 sns.set_palette("husl")
 
 class DataDisplayFrame(tk.Frame):
+    _report_gen = None
+
     def __init__(self, master, title):
         self.theme_colors = {
             'bg': '#f0f0f0',
@@ -34,6 +43,9 @@ class DataDisplayFrame(tk.Frame):
         super().__init__(master, bg=self.theme_colors['bg'])
         self.title = title
         self.analytics = ManagerAnalytics()
+        self._query_cache = OrderedDict()
+        self._pending_load = None
+        self._pending_future = None
         self.create_header()
 
     def create_header(self):
@@ -91,12 +103,15 @@ class DataDisplayFrame(tk.Frame):
             tree.heading(col, text=col.replace('_', ' ').title())
             tree.column(col, width=150, anchor="center")
 
-        for index, row in df.iterrows():
-            values = [str(val)[:100] + "..." if len(str(val)) > 100 else str(val) for val in row]
-            tree.insert("", "end", values=values)
-
+        self.fill_data_table(tree, df)
         return tree
 
+    def fill_data_table(self, tree, df):
+        tree.delete(*tree.get_children())
+        for row in df.itertuples(index=False, name=None):
+            values = [text[:100] + "..." if len(text) > 100 else text for text in map(str, row)]
+            tree.insert("", "end", values=values)
+
     def create_chart(self, df, chart_type="bar", x_col=None, y_col=None, figsize=(10, 5)):
         if df.empty:
             return None
@@ -135,6 +150,50 @@ class DataDisplayFrame(tk.Frame):
 
         return fig
 
+    def cached_query(self, key, fetch, *args, **kwargs):
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+        else:
+            df = fetch(*args, **kwargs)
+            if df.empty:
+                return df
+            self._query_cache[key] = df
+            if len(self._query_cache) > 32:
+                self._query_cache.popitem(last=False)
+        return self._query_cache[key].copy(deep=False)
+
+    def schedule_load(self, delay=250):
+        if self._pending_load is not None:
+            self.after_cancel(self._pending_load)
+        self._pending_load = self.after(delay, self._run_scheduled_load)
+
+    def _run_scheduled_load(self):
+        self._pending_load = None
+        self.load_data()
+
+    def destroy(self):
+        if self._pending_load is not None:
+            self.after_cancel(self._pending_load)
+            self._pending_load = None
+        # Drop the in-flight fetch so its done-callback fails the identity check and skips the dead widget
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+        super().destroy()
+
+    def get_report_generator(self):
+        if DataDisplayFrame._report_gen is None:
+            # reportlab and xlsxwriter load on the first export, not at startup
+            from report_generator import ManagerReportGenerator
+            DataDisplayFrame._report_gen = ManagerReportGenerator()
+        return DataDisplayFrame._report_gen
+
+    def clear_content(self):
+        # The header and controls are always the first two children
+        for widget in self.winfo_children()[2:]:
+            if isinstance(widget, tk.Frame):
+                widget.destroy()
+
     def export_pdf(self):
         messagebox.showinfo("Export", "PDF export functionality - override in child class")
 
@@ -142,6 +201,7 @@ class DataDisplayFrame(tk.Frame):
         messagebox.showinfo("Export", "Excel export functionality - override in child class")
 
     def refresh_data(self):
+        self._query_cache.clear()
         self.load_data()
 
 
@@ -256,7 +316,7 @@ class SalesTrend(DataDisplayFrame):
             default_start = today - timedelta(days=int(self.period_var.get()))
             self.start_date_entry.set_date(default_start)
             self.end_date_entry.set_date(today)
-            self.load_data()
+            self.schedule_load()
 
     def on_custom_date_apply(self):
         if self.use_custom_dates.get():
@@ -264,13 +324,11 @@ class SalesTrend(DataDisplayFrame):
 
     def on_filter_changed(self, event=None):
         if not self.use_custom_dates.get():
-            self.load_data()
+            self.schedule_load()
 
     def load_data(self):
         try:
-            for widget in self.winfo_children():
-                if isinstance(widget, tk.Frame) and widget != self.winfo_children()[0] and widget != self.winfo_children()[1]:
-                    widget.destroy()
+            self.clear_content()
 
             if self.use_custom_dates.get():
                 start_date = self.start_date_entry.get_date()
@@ -347,7 +405,7 @@ class SalesTrend(DataDisplayFrame):
                 df = self.analytics.get_sales_trend_analysis(days, self.metric_var.get())
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 charts = {}
                 if not df.empty:
                     df_chart = df.copy()
@@ -379,7 +437,7 @@ class SalesTrend(DataDisplayFrame):
                 df = self.analytics.get_sales_trend_analysis(days, self.metric_var.get())
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Sales Trend Analysis": df}
                 report_gen.generate_excel_report("Sales Trend Report", data_sections)
             else:
@@ -425,7 +483,7 @@ class CustomerTraffic(DataDisplayFrame):
         try:
             df = self.analytics.get_peak_shopping_hours(7)
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 charts = {}
                 chart_buffer = report_gen.create_chart(df, 'bar', 'Customer Traffic by Hour', 'hour', 'transaction_count')
                 charts['Traffic Chart'] = chart_buffer
@@ -441,7 +499,7 @@ class CustomerTraffic(DataDisplayFrame):
         try:
             df = self.analytics.get_peak_shopping_hours(7)
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Customer Traffic by Hour": df}
                 report_gen.generate_excel_report("Customer Traffic Report", data_sections)
             else:
@@ -600,7 +658,7 @@ class TopSelling(DataDisplayFrame):
             default_start = today - timedelta(days=int(self.period_var.get()))
             self.start_date_entry.set_date(default_start)
             self.end_date_entry.set_date(today)
-            self.load_data()
+            self.schedule_load()
 
     def on_custom_date_apply(self):
         if self.use_custom_dates.get():
@@ -608,13 +666,11 @@ class TopSelling(DataDisplayFrame):
 
     def on_filter_changed(self, event=None):
         if not self.use_custom_dates.get():
-            self.load_data()
+            self.schedule_load()
 
     def load_data(self):
         try:
-            for widget in self.winfo_children():
-                if isinstance(widget, tk.Frame) and widget != self.winfo_children()[0] and widget != self.winfo_children()[1]:
-                    widget.destroy()
+            self.clear_content()
 
             if self.use_custom_dates.get():
                 start_date = self.start_date_entry.get_date()
@@ -698,7 +754,7 @@ class TopSelling(DataDisplayFrame):
                 )
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 charts = {}
                 top_5 = df.head(5)
                 y_column_map = {
@@ -731,7 +787,7 @@ class TopSelling(DataDisplayFrame):
                 )
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Top Selling Products": df}
                 report_gen.generate_excel_report("Top Selling Products Report", data_sections)
             else:
@@ -780,7 +836,7 @@ class InventoryUsage(DataDisplayFrame):
         try:
             df = self.analytics.get_inventory_usage_trends()
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Inventory Usage and Restock Insights": df}
                 report_gen.generate_pdf_report("Inventory Usage Report", data_sections)
             else:
@@ -792,7 +848,7 @@ class InventoryUsage(DataDisplayFrame):
         try:
             df = self.analytics.get_inventory_usage_trends()
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Inventory Usage and Restock Insights": df}
                 report_gen.generate_excel_report("Inventory Usage Report", data_sections)
             else:
@@ -802,7 +858,7 @@ class InventoryUsage(DataDisplayFrame):
 
 
 class SalesForecast(DataDisplayFrame):
-    def __init__(self, master):
+    def __init__(self, master, executor):
         super().__init__(master, "Sales Forecast")
         self.period_var = tk.StringVar(value="30")
         self.forecast_type_var = tk.StringVar(value="moving_average")
@@ -810,7 +866,14 @@ class SalesForecast(DataDisplayFrame):
         self.use_custom_dates = tk.BooleanVar(value=False)
         self.start_date_entry = None
         self.end_date_entry = None
+        self._executor = executor
         self.create_controls()
+        self.busy_label = tk.Label(self, text="⏳ Loading forecast data...",
+                                   font=("Segoe UI", 11), bg=self.theme_colors['bg'], fg=self.theme_colors['fg'])
+        self.no_data_label = tk.Label(self, text="Insufficient data for forecasting (need at least 7 days)",
+                                      font=("Segoe UI", 16), bg=self.theme_colors['bg'],
+                                      fg=self.theme_colors['fg'])
+        self._content_frame = None
         self.load_data()
 
     def create_controls(self):
@@ -929,7 +992,7 @@ class SalesForecast(DataDisplayFrame):
             default_start = today - timedelta(days=int(self.period_var.get()))
             self.start_date_entry.set_date(default_start)
             self.end_date_entry.set_date(today)
-            self.load_data()
+            self.schedule_load()
 
     def on_custom_date_apply(self):
         if self.use_custom_dates.get():
@@ -937,14 +1000,10 @@ class SalesForecast(DataDisplayFrame):
 
     def on_filter_changed(self, event=None):
         if not self.use_custom_dates.get():
-            self.load_data()
+            self.schedule_load()
 
     def load_data(self):
         try:
-            for widget in self.winfo_children():
-                if isinstance(widget, tk.Frame) and widget != self.winfo_children()[0] and widget != self.winfo_children()[1]:
-                    widget.destroy()
-
             if self.use_custom_dates.get():
                 start_date = self.start_date_entry.get_date()
                 end_date = self.end_date_entry.get_date()
@@ -956,150 +1015,189 @@ class SalesForecast(DataDisplayFrame):
 
             forecast_type = self.forecast_type_var.get()
             forecast_days = int(self.forecast_days_var.get())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load forecast data: {str(e)}")
+            return
 
-            if start_date and end_date:
-                df = self.analytics.get_sales_forecast_data(days)
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+
+        self.busy_label.pack(pady=10)
+        params = (days, start_date, end_date, forecast_type, forecast_days)
+        future = self._executor.submit(self._fetch, days, forecast_type)
+        self._pending_future = future
+        future.add_done_callback(lambda f: self._schedule_render(f, params))
+
+    def _schedule_render(self, future, params):
+        try:
+            self.after(0, self._on_data_loaded, future, params)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _on_data_loaded(self, future, params):
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
+        self.busy_label.pack_forget()
+
+        try:
+            self._render(future.result(), *params)
+        except QueryError as e:
+            messagebox.showerror(e.title, str(e))
+            self._render(pd.DataFrame(), *params)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load forecast data: {str(e)}")
+
+    def _fetch(self, days, forecast_type):
+        df = self.analytics.get_sales_forecast_data(days)
+
+        if not df.empty and len(df) >= 7:
+            df['date'] = pd.to_datetime(df['date'])
+            df = df.sort_values('date')
+
+            if forecast_type == "moving_average":
+                window = min(7, len(df))
+                df['forecast'] = df['daily_revenue'].rolling(window=window).mean()
+            elif forecast_type == "linear_trend":
+                day_num = np.arange(len(df))
+                slope = (df['daily_revenue'].iloc[-1] - df['daily_revenue'].iloc[0]) / len(df)
+                df['forecast'] = df['daily_revenue'].iloc[0] + slope * day_num
+            elif forecast_type == "exponential":
+                alpha = 0.3
+                df['forecast'] = df['daily_revenue'].ewm(alpha=alpha).mean()
+
+            window_size = min(7, len(df) // 2)
+            df['moving_avg'] = df['daily_revenue'].rolling(window=window_size, min_periods=1).mean()
+
+            if forecast_type == "moving_average":
+                df['forecast'] = df['moving_avg']
+            elif forecast_type == "linear_trend":
+                x = np.arange(len(df))
+                y = df['daily_revenue'].values
+                z = np.polyfit(x, y, 1)
+                p = np.poly1d(z)
+                df['forecast'] = p(x)
+            elif forecast_type == "exponential":
+                alpha = 0.3
+                df['forecast'] = df['daily_revenue'].ewm(alpha=alpha, adjust=False).mean()
             else:
-                df = self.analytics.get_sales_forecast_data(days)
+                df['forecast'] = df['moving_avg']
 
-            if not df.empty and len(df) >= 7:
-                df['date'] = pd.to_datetime(df['date'])
-                df = df.sort_values('date')
-
-                if forecast_type == "moving_average":
-                    window = min(7, len(df))
-                    df['forecast'] = df['daily_revenue'].rolling(window=window).mean()
-                elif forecast_type == "linear_trend":
-                    df['day_num'] = range(len(df))
-                    slope = (df['daily_revenue'].iloc[-1] - df['daily_revenue'].iloc[0]) / len(df)
-                    df['forecast'] = df['daily_revenue'].iloc[0] + slope * df['day_num']
-                elif forecast_type == "exponential":
-                    alpha = 0.3
-                    df['forecast'] = df['daily_revenue'].ewm(alpha=alpha).mean()
+        return df
 
-                main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
-                main_frame.pack(fill="both", expand=True)
+    def _render(self, df, days, start_date, end_date, forecast_type, forecast_days):
+        if df.empty or len(df) < 7:
+            if self._content_frame is not None:
+                self._content_frame.pack_forget()
+            self.no_data_label.pack(expand=True)
+            return
 
-                info_frame = tk.Frame(main_frame, bg=self.theme_colors['secondary_bg'], relief="solid", bd=1)
-                info_frame.pack(fill="x", padx=10, pady=5)
+        self.no_data_label.pack_forget()
+        if self._content_frame is not None:
+            self._content_frame.destroy()
 
-                if self.use_custom_dates.get():
-                    info_text = f"📊 Sales Forecast: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
-                else:
-                    info_text = f"📊 Sales Forecast: {days} days historical data"
+        main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
+        main_frame.pack(fill="both", expand=True)
+        self._content_frame = main_frame
 
-                info_text += f" | Method: {forecast_type.replace('_', ' ').title()} | Forecast: {forecast_days} days"
+        info_frame = tk.Frame(main_frame, bg=self.theme_colors['secondary_bg'], relief="solid", bd=1)
+        info_frame.pack(fill="x", padx=10, pady=5)
 
-                tk.Label(info_frame, text=info_text,
-                        font=("Segoe UI", 11, "bold"), bg=self.theme_colors['secondary_bg'],
-                        fg=self.theme_colors['fg']).pack(pady=8)
+        if start_date and end_date:
+            info_text = f"📊 Sales Forecast: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        else:
+            info_text = f"📊 Sales Forecast: {days} days historical data"
 
-                chart_frame = tk.Frame(main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
-                chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        info_text += f" | Method: {forecast_type.replace('_', ' ').title()} | Forecast: {forecast_days} days"
 
-                fig, ax = plt.subplots(figsize=(12, 6), facecolor=self.theme_colors['chart_bg'])
-
-                window_size = min(7, len(df) // 2)
-                df['moving_avg'] = df['daily_revenue'].rolling(window=window_size, min_periods=1).mean()
-
-                if forecast_type == "moving_average":
-                    df['forecast'] = df['moving_avg']
-                elif forecast_type == "linear_trend":
-                    x = np.arange(len(df))
-                    y = df['daily_revenue'].values
-                    z = np.polyfit(x, y, 1)
-                    p = np.poly1d(z)
-                    df['forecast'] = p(x)
-                elif forecast_type == "exponential":
-                    alpha = 0.3
-                    df['forecast'] = df['daily_revenue'].ewm(alpha=alpha, adjust=False).mean()
-                else:
-                    df['forecast'] = df['moving_avg']
-
-                ax.plot(df['date'], df['daily_revenue'], label='Actual Revenue', marker='o', linewidth=2, alpha=0.8, color='#3498db')
-                ax.plot(df['date'], df['forecast'], label=f'{forecast_type.replace("_", " ").title()} Forecast',
-                       linestyle='--', linewidth=2, alpha=0.8, color='#27ae60')
-
-                last_date = df['date'].iloc[-1]
-                future_dates = [last_date + timedelta(days=i+1) for i in range(forecast_days)]
-
-                if forecast_type == "moving_average":
-                    recent_values = df['daily_revenue'].tail(window_size).values
-                    recent_trend = np.mean(np.diff(recent_values)) if len(recent_values) > 1 else 0
-                    base_value = df['forecast'].iloc[-1]
-                    future_values = [base_value + recent_trend * (i+1) for i in range(forecast_days)]
-
-                elif forecast_type == "linear_trend":
-                    x = np.arange(len(df))
-                    y = df['daily_revenue'].values
-                    z = np.polyfit(x, y, 1)
-                    p = np.poly1d(z)
-                    future_x = np.arange(len(df), len(df) + forecast_days)
-                    future_values = p(future_x)
-
-                elif forecast_type == "exponential":
-                    last_values = df['daily_revenue'].tail(10).values
-                    if len(last_values) > 1:
-                        recent_growth = np.mean(np.diff(last_values)) / np.mean(last_values[:-1])
-                        recent_growth = max(-0.1, min(0.1, recent_growth))
-                    else:
-                        recent_growth = 0.01
-
-                    last_forecast = df['forecast'].iloc[-1]
-                    future_values = []
-                    current_value = last_forecast
-                    for i in range(forecast_days):
-                        current_value = current_value * (1 + recent_growth) + np.random.normal(0, current_value * 0.05)
-                        future_values.append(max(0, current_value))
-
-                np.random.seed(42)
-                variability = np.std(df['daily_revenue']) * 0.1
-                future_values = [max(0, val + np.random.normal(0, variability)) for val in future_values]
-
-                ax.plot(future_dates, future_values, label='Future Forecast',
-                       linestyle=':', linewidth=3, alpha=0.7, color='#e74c3c', marker='s', markersize=4)
-
-                ax.set_xlabel('Date')
-                ax.set_ylabel('Daily Revenue ($)')
-                ax.set_title(f'Sales Forecast - {forecast_type.replace("_", " ").title()} Method')
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-                plt.xticks(rotation=45)
-                plt.tight_layout()
+        tk.Label(info_frame, text=info_text,
+                font=("Segoe UI", 11, "bold"), bg=self.theme_colors['secondary_bg'],
+                fg=self.theme_colors['fg']).pack(pady=8)
 
-                canvas = FigureCanvasTkAgg(fig, chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+        chart_frame = tk.Frame(main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
+        chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-                stats_frame = tk.LabelFrame(main_frame, text="Forecast Statistics",
-                                           font=("Segoe UI", 12, "bold"), bg=self.theme_colors['bg'],
-                                           fg=self.theme_colors['fg'])
-                stats_frame.pack(fill="x", padx=10, pady=5)
+        fig = Figure(figsize=(12, 6), facecolor=self.theme_colors['chart_bg'])
+        ax = fig.add_subplot(111)
+
+        window_size = min(7, len(df) // 2)
+
+        ax.plot(df['date'], df['daily_revenue'], label='Actual Revenue', marker='o', linewidth=2, alpha=0.8, color='#3498db')
+        ax.plot(df['date'], df['forecast'], label=f'{forecast_type.replace("_", " ").title()} Forecast',
+               linestyle='--', linewidth=2, alpha=0.8, color='#27ae60')
+
+        last_date = df['date'].iloc[-1]
+        future_dates = [last_date + timedelta(days=i+1) for i in range(forecast_days)]
+        steps = np.arange(1, forecast_days + 1)
+        rng = np.random.default_rng(42)
+
+        if forecast_type == "moving_average":
+            recent_values = df['daily_revenue'].tail(window_size).values
+            recent_trend = np.mean(np.diff(recent_values)) if len(recent_values) > 1 else 0
+            base_value = df['forecast'].iloc[-1]
+            future_values = base_value + recent_trend * steps
+
+        elif forecast_type == "linear_trend":
+            x = np.arange(len(df))
+            y = df['daily_revenue'].values
+            z = np.polyfit(x, y, 1)
+            p = np.poly1d(z)
+            future_x = np.arange(len(df), len(df) + forecast_days)
+            future_values = p(future_x)
+
+        elif forecast_type == "exponential":
+            last_values = df['daily_revenue'].tail(10).values
+            if len(last_values) > 1:
+                recent_growth = np.mean(np.diff(last_values)) / np.mean(last_values[:-1])
+                recent_growth = max(-0.1, min(0.1, recent_growth))
+            else:
+                recent_growth = 0.01
 
-                avg_revenue = df['daily_revenue'].mean()
-                forecast_avg = df['forecast'].iloc[-7:].mean() if len(df) >= 7 else df['forecast'].mean()
-                trend = "Increasing" if forecast_avg > avg_revenue else "Decreasing"
+            last_forecast = df['forecast'].iloc[-1]
+            base = last_forecast * (1 + recent_growth) ** steps
+            noise = rng.normal(0, np.abs(base) * 0.05, size=forecast_days)
+            future_values = np.maximum(0, base + noise)
 
-                mae = abs(df['daily_revenue'] - df['forecast']).mean()
-                accuracy = max(0, 100 - (mae / avg_revenue * 100)) if avg_revenue > 0 else 0
+        variability = np.std(df['daily_revenue']) * 0.1
+        future_values = np.maximum(0, future_values + rng.normal(0, variability, size=forecast_days))
 
-                future_avg = sum(future_values) / len(future_values) if future_values else 0
-                future_trend = "Increasing" if future_avg > forecast_avg else "Decreasing"
+        ax.plot(future_dates, future_values, label='Future Forecast',
+               linestyle=':', linewidth=3, alpha=0.7, color='#e74c3c', marker='s', markersize=4)
 
-                stats_text = (f"Historical Avg: ${avg_revenue:.2f} | "
-                            f"Recent Trend: {trend} | "
-                            f"Model Accuracy: {accuracy:.1f}% | "
-                            f"Future Prediction: ${future_avg:.2f} ({future_trend})")
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Daily Revenue ($)')
+        ax.set_title(f'Sales Forecast - {forecast_type.replace("_", " ").title()} Method')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.tick_params(axis='x', rotation=45)
+        fig.tight_layout()
 
-                tk.Label(stats_frame, text=stats_text, font=("Segoe UI", 10),
-                        bg=self.theme_colors['bg'], fg=self.theme_colors['fg']).pack(pady=8)
+        canvas = FigureCanvasTkAgg(fig, chart_frame)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
 
-            else:
-                tk.Label(self, text="Insufficient data for forecasting (need at least 7 days)",
-                        font=("Segoe UI", 16), bg=self.theme_colors['bg'],
-                        fg=self.theme_colors['fg']).pack(expand=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load forecast data: {str(e)}")
+        stats_frame = tk.LabelFrame(main_frame, text="Forecast Statistics",
+                                   font=("Segoe UI", 12, "bold"), bg=self.theme_colors['bg'],
+                                   fg=self.theme_colors['fg'])
+        stats_frame.pack(fill="x", padx=10, pady=5)
+
+        avg_revenue = df['daily_revenue'].mean()
+        forecast_avg = df['forecast'].iloc[-7:].mean() if len(df) >= 7 else df['forecast'].mean()
+        trend = "Increasing" if forecast_avg > avg_revenue else "Decreasing"
+
+        mae = abs(df['daily_revenue'] - df['forecast']).mean()
+        accuracy = max(0, 100 - (mae / avg_revenue * 100)) if avg_revenue > 0 else 0
+
+        future_avg = future_values.mean() if len(future_values) else 0
+        future_trend = "Increasing" if future_avg > forecast_avg else "Decreasing"
+
+        stats_text = (f"Historical Avg: ${avg_revenue:.2f} | "
+                    f"Recent Trend: {trend} | "
+                    f"Model Accuracy: {accuracy:.1f}% | "
+                    f"Future Prediction: ${future_avg:.2f} ({future_trend})")
+
+        tk.Label(stats_frame, text=stats_text, font=("Segoe UI", 10),
+                bg=self.theme_colors['bg'], fg=self.theme_colors['fg']).pack(pady=8)
 
     def export_pdf(self):
         try:
@@ -1113,7 +1211,7 @@ class SalesForecast(DataDisplayFrame):
                 df = self.analytics.get_sales_forecast_data(days=days)
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Sales Forecast Data": df}
                 report_gen.generate_pdf_report("Sales Forecast Report", data_sections)
             else:
@@ -1133,7 +1231,7 @@ class SalesForecast(DataDisplayFrame):
                 )
 
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Sales Forecast Data": df}
                 report_gen.generate_excel_report("Sales Forecast Report", data_sections)
             else:
@@ -1152,7 +1250,7 @@ class ManagerPage(tk.Frame):
         self.controller.title("Manager Page")
 
         self.sidebar_expand = False
-        self.separators = []
+        self.executor = ThreadPoolExecutor(max_workers=2)
 
         self.theme_colors = {
             'bg': '#f0f0f0', 'fg': '#333333', 'secondary_bg': '#ffffff',
@@ -1211,6 +1309,19 @@ class ManagerPage(tk.Frame):
             activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w", padx=15,
             command=self.show_sales_forecast)
 
+        self.role_header = tk.Label(self.sidebar, text="MANAGER",
+                                    bg="#34495e", fg="#ecf0f1", font=("Segoe UI", 11, "bold"),
+                                    anchor="center", pady=8)
+
+        nav_buttons = [self.sales_trend_button, self.customer_traffic_button, self.product_trends_button,
+                       self.top_selling_button, self.inventory_usage_button,
+                       self.promotion_effectiveness_button, self.sales_forecast_button]
+        self.sidebar_items = [(self.role_header, {'fill': 'x', 'pady': (15, 10)})]
+        for i, button in enumerate(nav_buttons):
+            if i > 0:
+                self.sidebar_items.append((self.separator(self.sidebar), {'fill': 'x', 'padx': 10, 'pady': (2, 5)}))
+            self.sidebar_items.append((button, {'fill': 'x', 'pady': (10, 0)}))
+
         self.content = tk.Frame(self.container, bg=self.theme_colors['bg'])
         self.content.pack(side="left", fill="both", expand=True)
 
@@ -1260,57 +1371,35 @@ class ManagerPage(tk.Frame):
             self.sidebar.config(width=50)
             self.toggle_button.config(text="☰", font=("Segoe UI", 14), anchor="center", padx=0)
             self.logout_button.pack_forget()
-            self.sales_trend_button.pack_forget()
-            self.customer_traffic_button.pack_forget()
-            self.product_trends_button.pack_forget()
-            self.top_selling_button.pack_forget()
-            self.inventory_usage_button.pack_forget()
-            self.promotion_effectiveness_button.pack_forget()
-            self.sales_forecast_button.pack_forget()
-
-            for sep in self.separators:
-                sep.destroy()
-            self.separators.clear()
+            for widget, _ in self.sidebar_items:
+                widget.pack_forget()
 
         else:
             self.sidebar.config(width=200)
             self.toggle_button.config(text="<", anchor="e", font=("Segoe UI", 14, "bold"), padx=20,)
             self.logout_button.pack(side="bottom", fill="x", pady=(10, 20), padx=20)
-
-            role_header = tk.Label(self.sidebar, text="MANAGER",
-                                  bg="#34495e", fg="#ecf0f1", font=("Segoe UI", 11, "bold"),
-                                  anchor="center", pady=8)
-            role_header.pack(fill="x", pady=(15, 10))
-            self.separators.append(role_header)
-
-            self.sales_trend_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.customer_traffic_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.product_trends_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.top_selling_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.inventory_usage_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.promotion_effectiveness_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.sales_forecast_button.pack(fill="x", pady=(10, 0))
+            for widget, options in self.sidebar_items:
+                widget.pack(**options)
         self.sidebar_expand = not self.sidebar_expand
 
     def click_outside(self, event):
+        if not self.sidebar_expand:
+            return
         try:
-            if self.sidebar_expand:
-                x, y = event.x_root, event.y_root
-                sidebar_x = self.sidebar.winfo_rootx()
-                sidebar_w = self.sidebar.winfo_width()
-
-                if x > sidebar_x + sidebar_w:
-                    self.toggle_sidebar()
+            # Compare widget paths so a click needs no geometry queries
+            widget, sidebar = str(event.widget), str(self.sidebar)
+            if widget != sidebar and not widget.startswith(sidebar + "."):
+                self.toggle_sidebar()
         except Exception:
             pass
 
+    def destroy(self):
+        # The click handler is global, so drop it with the page
+        self.unbind_all("<Button-1>")
+        super().destroy()
+
     def logout(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.controller.set_current_user(None)
         self.controller.show_frame("LoginPage")
         self.controller.title("LogicMart Analytics System - Login")
@@ -1332,7 +1421,7 @@ class ManagerPage(tk.Frame):
 
     def show_customer_traffic(self):
         self.clear_content()
-        self.current_content = CustomerTrafficAnalysis(self.content)
+        self.current_content = CustomerTrafficAnalysis(self.content, self.executor)
         self.current_content.pack(fill="both", expand=True)
 
     def show_top_selling(self):
@@ -1352,20 +1441,23 @@ class ManagerPage(tk.Frame):
 
     def show_sales_forecast(self):
         self.clear_content()
-        self.current_content = SalesForecast(self.content)
+        self.current_content = SalesForecast(self.content, self.executor)
         self.current_content.pack(fill="both", expand=True)
 
     def separator(self, parent):
-        separator = tk.Frame(parent, height=1, bg="#bdc3c7")
-        separator.pack(fill="x", padx=10, pady=(2, 5))
-        self.separators.append(separator)
+        return tk.Frame(parent, height=1, bg="#bdc3c7")
 
 
 class ProductSalesTrends(DataDisplayFrame):
     def __init__(self, master):
         super().__init__(master, "Product Sales Trends Analysis")
         self.period_var = tk.StringVar(value="30")
+        self._cached_df = pd.DataFrame()
+        self.main_frame = None
+        self.lines = {}
         self.create_controls()
+        self.no_data_label = tk.Label(self, text="No sales data available for the selected period",
+                                      font=("Segoe UI", 16), bg="#f0f0f0")
         self.load_data()
 
     def create_controls(self):
@@ -1386,84 +1478,100 @@ class ProductSalesTrends(DataDisplayFrame):
                 fg=self.theme_colors['fg']).pack(side="left")
 
     def on_period_changed(self, event=None):
-        self.load_data()
+        self.schedule_load()
 
     def load_data(self):
         try:
             days = int(self.period_var.get())
-            df = self.analytics.get_product_sales_trends(days=days, limit=10)
+            df = self.cached_query(('product_trends', days, 10),
+                                   self.analytics.get_product_sales_trends, days=days, limit=10)
+            self._cached_df = df
+
+            if df.empty:
+                if self.main_frame is not None:
+                    self.main_frame.pack_forget()
+                self.no_data_label.pack(expand=True)
+                return
+
+            self.no_data_label.pack_forget()
+            if self.main_frame is None:
+                self.build_chart()
+            self.main_frame.pack(fill="both", expand=True)
+
+            products = df['product_name'].unique()[:5]
+
+            wanted = set(products)
+            # Drop lines for products that left the top set so the axes don't accumulate stale artists
+            for key in [key for key in self.lines if key[0] not in wanted]:
+                self.lines.pop(key).remove()
+
+            grouped = {name: group.sort_values('sale_date')
+                       for name, group in df.groupby('product_name', sort=False) if name in wanted}
+
+            for product in products:
+                product_data = grouped[product]
+                for ax, metric, col, marker in ((self.axes[0], 'qty', 'daily_quantity', 'o'),
+                                                (self.axes[1], 'revenue', 'daily_revenue', 's')):
+                    x, y = downsample_lttb(product_data['sale_date'].values, product_data[col].values)
+                    line = self.lines.get((product, metric))
+                    if line is None:
+                        line = ax.plot(x, y, marker=marker, label=product,
+                                       linewidth=2, markersize=4)[0]
+                        self.lines[(product, metric)] = line
+                    else:
+                        line.set_data(x, y)
 
-            for widget in self.winfo_children():
-                if isinstance(widget, tk.Frame) and widget != self.winfo_children()[0] and widget != self.winfo_children()[1]:
-                    widget.destroy()
+            for ax in self.axes:
+                ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+                ax.relim()
+                ax.autoscale_view()
 
-            if not df.empty:
-                main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
-                main_frame.pack(fill="both", expand=True)
+            self.canvas.draw_idle()
 
-                products = df['product_name'].unique()[:5]
+            for widget in self.summary_frame.winfo_children():
+                widget.destroy()
 
-                chart_frame = tk.Frame(main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
-                chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
+            summary_df = self.cached_query(('product_summary', days), self.summarize_products, df)
+
+            self.create_data_table(summary_df, self.summary_frame)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load sales trends data: {str(e)}")
 
-                fig, axes = plt.subplots(2, 1, figsize=(14, 10), facecolor='white', constrained_layout=True)
-
-                for i, product in enumerate(products):
-                    product_data = df[df['product_name'] == product].copy()
-                    if not product_data.empty:
-                        product_data = product_data.sort_values('sale_date')
-                        axes[0].plot(product_data['sale_date'], product_data['daily_quantity'],
-                                   marker='o', label=product, linewidth=2, markersize=4)
-
-                axes[0].set_title('Daily Quantity Sold - Top Products')
-                axes[0].set_xlabel('Date')
-                axes[0].set_ylabel('Quantity Sold')
-                axes[0].legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-                axes[0].grid(True, alpha=0.3)
-                axes[0].tick_params(axis='x', rotation=45)
-
-                for i, product in enumerate(products):
-                    product_data = df[df['product_name'] == product].copy()
-                    if not product_data.empty:
-                        product_data = product_data.sort_values('sale_date')
-                        axes[1].plot(product_data['sale_date'], product_data['daily_revenue'],
-                                   marker='s', label=product, linewidth=2, markersize=4)
-
-                axes[1].set_title('Daily Revenue - Top Products')
-                axes[1].set_xlabel('Date')
-                axes[1].set_ylabel('Revenue ($)')
-                axes[1].legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-                axes[1].grid(True, alpha=0.3)
-                axes[1].tick_params(axis='x', rotation=45)
+    def summarize_products(self, df):
+        columns = ['product_name', 'category', 'total_quantity', 'avg_daily_quantity', 'days_with_sales']
+        return df[columns].drop_duplicates(subset=['product_name', 'category']).reset_index(drop=True)
 
+    def build_chart(self):
+        self.main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
 
-                canvas = FigureCanvasTkAgg(fig, chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+        chart_frame = tk.Frame(self.main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
+        chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-                summary_frame = tk.LabelFrame(main_frame, text="Product Performance Summary",
-                                            font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
-                summary_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self.fig = Figure(figsize=(14, 10), facecolor='white', constrained_layout=True)
+        self.axes = self.fig.subplots(2, 1)
 
-                summary_df = df.groupby(['product_name', 'category']).agg({
-                    'total_quantity': 'first',
-                    'avg_daily_quantity': 'first',
-                    'days_with_sales': 'first'
-                }).reset_index()
+        self.axes[0].set_title('Daily Quantity Sold - Top Products')
+        self.axes[0].set_xlabel('Date')
+        self.axes[0].set_ylabel('Quantity Sold')
+        self.axes[1].set_title('Daily Revenue - Top Products')
+        self.axes[1].set_xlabel('Date')
+        self.axes[1].set_ylabel('Revenue ($)')
+        for ax in self.axes:
+            ax.grid(True, alpha=0.3)
+            ax.tick_params(axis='x', rotation=45)
 
-                self.create_data_table(summary_df, summary_frame)
-            else:
-                tk.Label(self, text="No sales data available for the selected period",
-                        font=("Segoe UI", 16), bg="#f0f0f0").pack(expand=True)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load sales trends data: {str(e)}")
+        self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.summary_frame = tk.LabelFrame(self.main_frame, text="Product Performance Summary",
+                                           font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
+        self.summary_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
     def export_pdf(self):
         try:
-            days = int(self.period_var.get())
-            df = self.analytics.get_product_sales_trends(days=days, limit=10)
+            df = self._cached_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 report_gen.generate_comprehensive_report({"product_trends": df}, 'pdf')
                 messagebox.showinfo("Export Success", "Product sales trends exported to PDF successfully!")
             else:
@@ -1473,10 +1581,9 @@ class ProductSalesTrends(DataDisplayFrame):
 
     def export_excel(self):
         try:
-            days = int(self.period_var.get())
-            df = self.analytics.get_product_sales_trends(days=days, limit=10)
+            df = self._cached_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 report_gen.generate_comprehensive_report({"product_trends": df}, 'excel')
                 messagebox.showinfo("Export Success", "Product sales trends exported to Excel successfully!")
             else:
@@ -1484,19 +1591,22 @@ class ProductSalesTrends(DataDisplayFrame):
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
 
-    def refresh_data(self):
-        self.load_data()
-
 
 class CustomerTrafficAnalysis(DataDisplayFrame):
-    def __init__(self, master):
+    def __init__(self, master, executor):
         super().__init__(master, "Customer Traffic Analysis")
         self.period_var = tk.StringVar(value="7")
         self.use_custom_dates = tk.BooleanVar(value=False)
         self.data_history = {}
+        self.current_df = pd.DataFrame()
         self.start_date_entry = None
         self.end_date_entry = None
+        self.main_frame = None
+        self.no_data_frame = None
+        self._executor = executor
         self.create_controls()
+        self.busy_label = tk.Label(self, text="⏳ Loading traffic data...",
+                                   font=("Segoe UI", 11), bg=self.theme_colors['bg'], fg=self.theme_colors['fg'])
         self.load_data()
 
     def create_controls(self):
@@ -1578,7 +1688,7 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
         enabled = self.use_custom_dates.get()
         self.toggle_date_controls(enabled)
         if not enabled:
-            self.load_data()
+            self.schedule_load()
 
     def on_custom_date_apply(self):
         if self.use_custom_dates.get():
@@ -1586,36 +1696,30 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
 
     def on_filter_changed(self, event=None):
         if not self.use_custom_dates.get():
-            self.load_data()
+            self.schedule_load()
 
-    def add_to_history(self):
-        start_date, end_date = None, None
+    def resolve_range(self):
         if self.use_custom_dates.get():
             start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
             end_date = datetime.combine(self.end_date_entry.get_date(), datetime.max.time())
-            period_type = 'day'
+            period_type = 'day' # Default to day view for custom ranges
         else:
             days = int(self.period_var.get())
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
+            period_type = 'day' if days <= 60 else 'week' # Use week view for longer periods
+        return start_date, end_date, period_type
 
-            if days <= 2:
-                period_type = 'hour'
-            elif days <= 90:
-                period_type = 'day'
-            else:
-                period_type = 'week'
-        if hasattr(self, 'current_df') and not self.current_df.empty:
+    def add_to_history(self):
+        if not self.current_df.empty:
+            start_date, end_date, period_type = self.resolve_range()
             if self.use_custom_dates.get():
-                start_date = self.start_date_entry.get_date()
-                end_date = self.end_date_entry.get_date()
                 label = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
             else:
-                period_labels = {"hour": "Last 24 Hours", "day": "Last 7 Days", "week": "Last 4 Weeks", "month": "Last 8 Weeks"}
-                label = f"{period_labels.get(period_type)} ({datetime.now().strftime('%H:%M')})"
+                label = f"Last {self.period_var.get()} Days ({datetime.now().strftime('%H:%M')})"
 
             key = f"{label}_{len(self.data_history)}"
-            self.data_history[key] = {'data': self.current_df.copy(), 'label': label, 'period_type': period_type}
+            self.data_history[key] = {'data': self.current_df, 'label': label, 'period_type': period_type}
             self.load_data()
             messagebox.showinfo("Added to Chart", f"Data layer added: {label}")
 
@@ -1626,38 +1730,96 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
 
     def load_data(self):
         try:
-            start_date, end_date = None, None
+            start_date, end_date, period_type = self.resolve_range()
             if self.use_custom_dates.get():
-                start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
-                end_date = datetime.combine(self.end_date_entry.get_date(), datetime.max.time())
-                period_type = 'day' # Default to day view for custom ranges
+                cache_key = ('traffic', period_type, start_date, end_date)
             else:
-                days = int(self.period_var.get())
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-                period_type = 'day' if days <= 60 else 'week' # Use week view for longer periods
+                cache_key = ('traffic', period_type, int(self.period_var.get()))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load traffic data: {str(e)}")
+            return
 
-            df = self.analytics.get_customer_traffic_analysis(period_type, start_date, end_date)
-            self.current_df = df
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
 
-            for widget in self.winfo_children():
-                if isinstance(widget, tk.Frame) and widget not in [self.winfo_children()[0], self.winfo_children()[1]]:
-                    widget.destroy()
+        params = (period_type, start_date, end_date)
+        if cache_key in self._query_cache:
+            self.busy_label.pack_forget()
+            self._render(self.cached_query(cache_key, self.analytics.get_customer_traffic_analysis, *params), *params)
+            return
 
-            if not df.empty:
-                self.display_traffic_data(df, period_type, start_date, end_date)
-            else:
-                self.display_no_data_message(period_type, start_date, end_date)
+        self.busy_label.pack(pady=10)
+        future = self._executor.submit(self.analytics.get_customer_traffic_analysis, *params)
+        self._pending_future = future
+        future.add_done_callback(lambda f: self._schedule_render(f, cache_key, params))
+
+    def _schedule_render(self, future, cache_key, params):
+        try:
+            self.after(0, self._on_data_loaded, future, cache_key, params)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _on_data_loaded(self, future, cache_key, params):
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
+        self.busy_label.pack_forget()
+
+        try:
+            self._render(self.cached_query(cache_key, future.result), *params)
+        except QueryError as e:
+            messagebox.showerror(e.title, str(e))
+            self._render(pd.DataFrame(), *params)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load traffic data: {str(e)}")
 
-    def display_traffic_data(self, df, period_type, start_date, end_date):
-        main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
-        main_frame.pack(fill="both", expand=True)
+    def _render(self, df, period_type, start_date, end_date):
+        self.current_df = df
+        if not df.empty:
+            self.display_traffic_data(df, period_type, start_date, end_date)
+        else:
+            self.display_no_data_message(period_type, start_date, end_date)
 
-        info_frame = tk.Frame(main_frame, bg=self.theme_colors['secondary_bg'], relief="solid", bd=1)
+    def build_chart(self):
+        self.main_frame = tk.Frame(self, bg=self.theme_colors['bg'])
+
+        info_frame = tk.Frame(self.main_frame, bg=self.theme_colors['secondary_bg'], relief="solid", bd=1)
         info_frame.pack(fill="x", padx=10, pady=5)
 
+        self.info_label = tk.Label(info_frame, font=("Segoe UI", 11, "bold"),
+                                   bg=self.theme_colors['secondary_bg'], fg=self.theme_colors['fg'])
+        self.info_label.pack(pady=8)
+
+        chart_frame = tk.Frame(self.main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
+        chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
+
+        self.fig = Figure(figsize=(18, 12), facecolor=self.theme_colors['chart_bg'], constrained_layout=True)
+        self.axes = self.fig.subplots(2, 2)
+
+        chart_titles = ['Transaction Volume', 'Items Sold', 'Revenue Performance', 'Avg Transaction Value']
+        for i, ax in enumerate(self.axes.flat):
+            ax.grid(True, alpha=0.3, color=self.theme_colors['grid_color'])
+            ax.tick_params(axis='y', labelsize=8)
+            if i in [2, 3]: ax.yaxis.set_major_formatter(StrMethodFormatter('${x:,.0f}'))
+            ax.set_title(chart_titles[i], fontsize=11, fontweight='bold', pad=12, color=self.theme_colors['text_color'])
+
+        self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+        stats_frame = tk.LabelFrame(self.main_frame, text="Traffic Summary", font=("Segoe UI", 12, "bold"), bg=self.theme_colors['bg'], fg=self.theme_colors['fg'])
+        stats_frame.pack(fill="x", padx=10, pady=5)
+
+        self.stats_label = tk.Label(stats_frame, font=("Segoe UI", 10), bg=self.theme_colors['bg'], fg=self.theme_colors['fg'])
+        self.stats_label.pack(pady=8)
+
+    def display_traffic_data(self, df, period_type, start_date, end_date):
+        if self.no_data_frame is not None:
+            self.no_data_frame.pack_forget()
+        if self.main_frame is None:
+            self.build_chart()
+        self.main_frame.pack(fill="both", expand=True)
+
         if self.use_custom_dates.get() and start_date and end_date:
             info_text = f"📊 Custom Period: {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
         else:
@@ -1667,51 +1829,51 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
         if len(self.data_history) > 0:
             info_text += f" | {len(self.data_history)} comparison layers active"
 
-        tk.Label(info_frame, text=info_text,
-                font=("Segoe UI", 11, "bold"), bg=self.theme_colors['secondary_bg'],
-                fg=self.theme_colors['fg']).pack(pady=8)
+        self.info_label.config(text=info_text)
 
-        chart_frame = tk.Frame(main_frame, bg=self.theme_colors['chart_bg'], relief="solid", bd=1)
-        chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        tc = self.theme_colors
+        text_c, legend_bg, chart_colors = tc['text_color'], tc['secondary_bg'], tc['chart_colors']
 
-        fig, axes = plt.subplots(2, 2, figsize=(18, 12), facecolor=self.theme_colors['chart_bg'])
-        fig.suptitle(f'Customer Traffic Analysis - {period_type.title()} View', fontsize=15, fontweight='bold', color=self.theme_colors['text_color'], y=0.97)
-        plt.subplots_adjust(left=0.1, bottom=0.15, right=0.95, top=0.88, wspace=0.35, hspace=0.45)
+        axes = self.axes
+        for ax in axes.flat:
+            for line in list(ax.get_lines()):
+                line.remove()
+        self.fig.suptitle(f'Customer Traffic Analysis - {period_type.title()} View', fontsize=15, fontweight='bold', color=text_c, y=0.97)
 
-        self.plot_traffic_data(axes, df, "Current Period", self.theme_colors['chart_colors'][0], alpha=1.0)
+        self.plot_traffic_data(axes, df, "Current Period", chart_colors[0], alpha=1.0)
 
         for i, (key, hist_data) in enumerate(self.data_history.items()):
             if hist_data['period_type'] == period_type:
-                self.plot_traffic_data(axes, hist_data['data'], hist_data['label'], self.theme_colors['chart_colors'][(i+1) % len(self.theme_colors['chart_colors'])], alpha=0.6)
+                self.plot_traffic_data(axes, hist_data['data'], hist_data['label'], chart_colors[(i+1) % len(chart_colors)], alpha=0.6)
 
-        chart_titles = ['Transaction Volume', 'Items Sold', 'Revenue Performance', 'Avg Transaction Value']
-        for i, ax in enumerate(axes.flat):
-            ax.grid(True, alpha=0.3, color=self.theme_colors['grid_color'])
-            ax.legend(loc='upper right', framealpha=0.9, facecolor=self.theme_colors['secondary_bg'], edgecolor=self.theme_colors['text_color'], fontsize=8, bbox_to_anchor=(0.98, 0.98))
+        if not df.empty:
+            period_labels = df.drop_duplicates('time_period').set_index('time_period')['period_label'].sort_index()
+            periods, labels = period_labels.index.to_numpy(), period_labels.to_numpy()
+            step = len(periods) // 5 if len(periods) > 10 else 1
+            display_periods, display_labels = periods[::step], labels[::step]
+
+        for ax in axes.flat:
+            ax.relim()
+            ax.autoscale_view()
+            ax.legend(loc='upper right', framealpha=0.9, facecolor=legend_bg, edgecolor=text_c, fontsize=8, bbox_to_anchor=(0.98, 0.98))
             if not df.empty:
-                periods = sorted(df['time_period'].unique())
-                labels = [df[df['time_period'] == p]['period_label'].iloc[0] for p in periods]
-                display_periods, display_labels = (periods[::len(periods)//5], [labels[periods.index(p)] for p in periods[::len(periods)//5]]) if len(periods) > 10 else (periods, labels)
                 ax.set_xticks(display_periods)
                 ax.set_xticklabels(display_labels, rotation=30, ha='right')
-            ax.tick_params(axis='y', labelsize=8)
-            if i in [2, 3]: ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-            ax.set_title(chart_titles[i], fontsize=11, fontweight='bold', pad=12, color=self.theme_colors['text_color'])
 
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-
-        stats_frame = tk.LabelFrame(main_frame, text="Traffic Summary", font=("Segoe UI", 12, "bold"), bg=self.theme_colors['bg'], fg=self.theme_colors['fg'])
-        stats_frame.pack(fill="x", padx=10, pady=5)
+        self.canvas.draw_idle()
 
         total_transactions, total_items, total_revenue, avg_transaction = df['transaction_count'].sum(), df['items_sold'].sum(), df['total_revenue'].sum(), df['avg_transaction_value'].mean()
         stats_text = f"Total Transactions: {total_transactions:,} | Items Sold: {int(total_items):,} | Total Revenue: ${total_revenue:,.2f} | Avg Transaction: ${avg_transaction:.2f}"
-        tk.Label(stats_frame, text=stats_text, font=("Segoe UI", 10), bg=self.theme_colors['bg'], fg=self.theme_colors['fg']).pack(pady=8)
+        self.stats_label.config(text=stats_text)
 
     def display_no_data_message(self, period_type, start_date, end_date):
+        if self.main_frame is not None:
+            self.main_frame.pack_forget()
+        if self.no_data_frame is not None:
+            self.no_data_frame.destroy()
         no_data_frame = tk.Frame(self, bg=self.theme_colors['bg'])
         no_data_frame.pack(fill="both", expand=True)
+        self.no_data_frame = no_data_frame
         center_frame = tk.Frame(no_data_frame, bg=self.theme_colors['bg'])
         center_frame.place(relx=0.5, rely=0.5, anchor="center")
         tk.Label(center_frame, text="📊 No Customer Traffic Data", font=("Segoe UI", 20, "bold"), bg=self.theme_colors['bg'], fg=self.theme_colors['fg']).pack(pady=10)
@@ -1724,43 +1886,22 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
         if df.empty: return
         try:
             df_sorted = df.sort_values('time_period')
-            axes[0, 0].plot(df_sorted['time_period'], df_sorted['transaction_count'], label=label, color=color, alpha=alpha, linewidth=linewidth, marker='o', markersize=4)
-            axes[0, 0].set_ylabel('Transaction Count')
-            axes[0, 1].plot(df_sorted['time_period'], df_sorted['items_sold'], label=label, color=color, alpha=alpha, linewidth=linewidth, marker='s', markersize=4)
-            axes[0, 1].set_ylabel('Items Sold')
-            axes[1, 0].plot(df_sorted['time_period'], df_sorted['total_revenue'], label=label, color=color, alpha=alpha, linewidth=linewidth, marker='^', markersize=4)
-            axes[1, 0].set_ylabel('Revenue ($)')
-            axes[1, 1].plot(df_sorted['time_period'], df_sorted['avg_transaction_value'], label=label, color=color, alpha=alpha, linewidth=linewidth, marker='d', markersize=4)
-            axes[1, 1].set_ylabel('Avg Transaction ($)')
+            series = [(axes[0, 0], 'transaction_count', 'Transaction Count', 'o'),
+                      (axes[0, 1], 'items_sold', 'Items Sold', 's'),
+                      (axes[1, 0], 'total_revenue', 'Revenue ($)', '^'),
+                      (axes[1, 1], 'avg_transaction_value', 'Avg Transaction ($)', 'd')]
+            for ax, col, ylabel, marker in series:
+                x, y = downsample_lttb(df_sorted['time_period'].values, df_sorted[col].values)
+                ax.plot(x, y, label=label, color=color, alpha=alpha, linewidth=linewidth, marker=marker, markersize=4)
+                ax.set_ylabel(ylabel)
         except Exception as e:
             print(f"Error plotting traffic data: {e}")
 
     def export_pdf(self):
         try:
-            start_date, end_date = None, None
-            if self.use_custom_dates.get():
-                start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
-                end_date = datetime.combine(self.end_date_entry.get_date(), datetime.max.time())
-                period_type = 'day'
-            else:
-                days = int(self.period_var.get())
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-
-                if days <= 2:
-                    period_type = 'hour'
-                elif days <= 90:
-                    period_type = 'day'
-                else:
-                    period_type = 'week'
-            start_date, end_date = None, None
-            if self.use_custom_dates.get():
-                start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
-                end_date = datetime.combine(self.end_date_entry.get_date(), datetime.max.time())
-
-            df = self.analytics.get_customer_traffic_analysis(period_type, start_date, end_date)
+            df = self.current_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 report_gen.generate_comprehensive_report({"peak_hours": df}, 'pdf')
                 messagebox.showinfo("Export Success", "Customer traffic analysis exported to PDF successfully!")
             else:
@@ -1770,15 +1911,9 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
 
     def export_excel(self):
         try:
-            period_type = self.period_type_var.get()
-            start_date, end_date = None, None
-            if self.use_custom_dates.get():
-                start_date = datetime.combine(self.start_date_entry.get_date(), datetime.min.time())
-                end_date = datetime.combine(self.end_date_entry.get_date(), datetime.max.time())
-
-            df = self.analytics.get_customer_traffic_analysis(period_type, start_date, end_date)
+            df = self.current_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 report_gen.generate_comprehensive_report({"peak_hours": df}, 'excel')
                 messagebox.showinfo("Export Success", "Customer traffic analysis exported to Excel successfully!")
             else:
@@ -1786,9 +1921,6 @@ class CustomerTrafficAnalysis(DataDisplayFrame):
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
 
-    def refresh_data(self):
-        self.load_data()
-
 
 class PromotionEffectiveness(DataDisplayFrame):
     def __init__(self, master):
@@ -1798,7 +1930,9 @@ class PromotionEffectiveness(DataDisplayFrame):
         self.status_var = tk.StringVar(value="all")
         self.start_date_var = tk.StringVar()
         self.end_date_var = tk.StringVar()
+        self._last_df = pd.DataFrame()
         self.setup_controls()
+        self.build_view()
         self.load_data()
 
     def setup_controls(self):
@@ -1827,7 +1961,7 @@ class PromotionEffectiveness(DataDisplayFrame):
         status_combo.pack(side="left", padx=(0, 15))
         status_combo.bind("<<ComboboxSelected>>", self.on_filter_change)
 
-        refresh_btn = tk.Button(row1_frame, text="🔄 Refresh", command=self.load_data, bg="#3498db", fg="white", font=("Segoe UI", 9, "bold"), relief="raised", bd=2)
+        refresh_btn = tk.Button(row1_frame, text="🔄 Refresh", command=self.refresh_data, bg="#3498db", fg="white", font=("Segoe UI", 9, "bold"), relief="raised", bd=2)
         refresh_btn.pack(side="right", padx=(10, 0))
 
         row2_frame = tk.Frame(self.control_frame, bg="#e8f4f8")
@@ -1836,6 +1970,12 @@ class PromotionEffectiveness(DataDisplayFrame):
         self.date_frame = tk.Frame(row2_frame, bg="#e8f4f8")
         self.date_frame.pack(side="left", padx=(15, 0))
 
+        self.start_date_picker = None
+        self.end_date_picker = None
+
+        self.date_frame.pack_forget()
+
+    def create_date_pickers(self):
         tk.Label(self.date_frame, text="From:", font=("Segoe UI", 9, "bold"), bg="#e8f4f8").pack(side="left")
 
         self.start_date_picker = DateEntry(self.date_frame, width=10, background='darkblue', foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd')
@@ -1846,115 +1986,142 @@ class PromotionEffectiveness(DataDisplayFrame):
         self.end_date_picker = DateEntry(self.date_frame, width=10, background='darkblue', foreground='white', borderwidth=2, date_pattern='yyyy-mm-dd')
         self.end_date_picker.pack(side="left", padx=5)
 
-        self.date_frame.pack_forget()
-
     def on_filter_change(self, event=None):
-        if self.period_var.get() == "custom":
+        if self.period_var.get().lower() == "custom":
+            if self.start_date_picker is None:
+                self.create_date_pickers()
             self.date_frame.pack(side="left", padx=(15, 0))
         else:
             self.date_frame.pack_forget()
-        self.load_data()
+        self.schedule_load()
+
+    def filter_kwargs(self):
+        promotion_type = self.promotion_type_var.get()
+        status = self.status_var.get()
+        kwargs = {
+            'days': 30,
+            'promotion_type': promotion_type if promotion_type != "all" else None,
+            'status': status if status != "all" else None,
+            'start_date': None,
+            'end_date': None
+        }
+        if self.period_var.get().lower() == "custom":
+            if self.start_date_picker is None:
+                self.create_date_pickers()
+            kwargs['start_date'] = self.start_date_picker.get_date()
+            kwargs['end_date'] = self.end_date_picker.get_date()
+        else:
+            kwargs['days'] = int(self.period_var.get())
+        return kwargs
 
     def load_data(self):
         try:
-            for widget in self.winfo_children():
-                if widget != self.control_frame:
-                    widget.destroy()
-
-            period_str = self.period_var.get()
-            promotion_type = self.promotion_type_var.get() if self.promotion_type_var.get() != "all" else None
-            status = self.status_var.get() if self.status_var.get() != "all" else None
-
-            days = 30
-            start_date = None
-            end_date = None
-
-            if period_str == "Custom":
-                start_date = self.start_date_picker.get_date()
-                end_date = self.end_date_picker.get_date()
-            else:
-                days = int(period_str)
-
-            df = self.analytics.get_promotion_effectiveness(days=days, promotion_type=promotion_type, status=status, start_date=start_date, end_date=end_date)
+            kwargs = self.filter_kwargs()
+            df = self.cached_query(('promotions',) + tuple(kwargs.values()),
+                                   self.analytics.get_promotion_effectiveness, **kwargs)
+            self._last_df = df
 
             if not df.empty:
                 self.display_promotion_data(df)
             else:
-                tk.Label(self, text="No promotion data available for the selected filters.", font=("Segoe UI", 16), bg="#f0f0f0").pack(expand=True)
+                self.separator_bar.pack_forget()
+                self.main_frame.pack_forget()
+                self.no_data_label.pack(expand=True)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load promotion data: {str(e)}")
 
-    def display_promotion_data(self, df):
-        separator = tk.Frame(self, height=2, bg="#34495e")
-        separator.pack(fill="x", padx=20, pady=5)
+    def build_view(self):
+        self.no_data_label = tk.Label(self, text="No promotion data available for the selected filters.", font=("Segoe UI", 16), bg="#f0f0f0")
 
-        main_frame = tk.Frame(self, bg="#f0f0f0")
-        main_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        self.separator_bar = tk.Frame(self, height=2, bg="#34495e")
+        self.main_frame = tk.Frame(self, bg="#f0f0f0")
 
-        metrics_frame = tk.Frame(main_frame, bg="#f0f0f0")
+        metrics_frame = tk.Frame(self.main_frame, bg="#f0f0f0")
         metrics_frame.pack(fill="x", pady=(0, 10))
 
-        total_promotions, active_promotions = len(df), df['is_active'].sum()
-        total_revenue, total_transactions = df['total_revenue'].sum(), df['transactions_count'].sum()
-        avg_discount = df[df['discount_percentage'] > 0]['discount_percentage'].mean() if not df[df['discount_percentage'] > 0].empty else 0
-
         metric_cards = [
-            ("Total Promotions", total_promotions, "#34495e"),
-            ("Active Promotions", active_promotions, "#27ae60"),
-            ("Total Revenue", f"${total_revenue:,.2f}", "#e74c3c"),
-            ("Avg Discount", f"{avg_discount:.1f}%", "#f39c12"),
-            ("Total Transactions", int(total_transactions), "#8e44ad")
+            ("Total Promotions", "#34495e"),
+            ("Active Promotions", "#27ae60"),
+            ("Total Revenue", "#e74c3c"),
+            ("Avg Discount", "#f39c12"),
+            ("Total Transactions", "#8e44ad")
         ]
 
-        for title, value, color in metric_cards:
+        self.metric_labels = {}
+        for title, color in metric_cards:
             card = tk.Frame(metrics_frame, bg=color, relief="raised", bd=2)
             card.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-            tk.Label(card, text=str(value), font=("Segoe UI", 16, "bold"), bg=color, fg="white").pack(pady=(10, 5))
+            self.metric_labels[title] = tk.Label(card, font=("Segoe UI", 16, "bold"), bg=color, fg="white")
+            self.metric_labels[title].pack(pady=(10, 5))
             tk.Label(card, text=title, font=("Segoe UI", 10), bg=color, fg="white").pack(pady=(0, 10))
 
-        chart_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
+        chart_frame = tk.Frame(self.main_frame, bg="white", relief="solid", bd=1)
         chart_frame.pack(fill="both", expand=True, pady=(0, 10))
 
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6), facecolor='white')
+        self.fig = Figure(figsize=(14, 6), facecolor='white', constrained_layout=True)
+        self.axes = self.fig.subplots(1, 2)
+        self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.table_frame = tk.LabelFrame(self.main_frame, text="Promotion Details", font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
+        self.table_frame.pack(fill="both", expand=True)
+        self.tree = None
 
-        top_promos = df.nlargest(8, 'total_revenue')
+    def display_promotion_data(self, df):
+        self.no_data_label.pack_forget()
+        self.separator_bar.pack(fill="x", padx=20, pady=5)
+        self.main_frame.pack(fill="both", expand=True, padx=10, pady=5)
+
+        totals = df[['is_active', 'total_revenue', 'transactions_count']].sum()
+        total_promotions, active_promotions = len(df), int(totals['is_active'])
+        total_revenue, total_transactions = totals['total_revenue'], totals['transactions_count']
+        discounts = df['discount_percentage'].to_numpy(dtype=float)
+        discounts = discounts[discounts > 0]
+        avg_discount = float(discounts.mean()) if discounts.size else 0
+
+        metric_values = {
+            "Total Promotions": total_promotions,
+            "Active Promotions": active_promotions,
+            "Total Revenue": f"${total_revenue:,.2f}",
+            "Avg Discount": f"{avg_discount:.1f}%",
+            "Total Transactions": int(total_transactions)
+        }
+        for title, value in metric_values.items():
+            self.metric_labels[title].config(text=str(value))
+
+        axes = self.axes
+        axes[0].clear()
+        revenue = df['total_revenue'].to_numpy(dtype=float)
+        k = min(8, len(revenue))
+        top_idx = np.argpartition(-revenue, k - 1)[:k]
+        top_promos = df.iloc[top_idx[np.argsort(-revenue[top_idx], kind='stable')]]
         axes[0].bar(top_promos['promotion_name'], top_promos['total_revenue'], color='#3498db', alpha=0.8)
         axes[0].set_title('Revenue by Promotion', fontsize=12, fontweight='bold')
         axes[0].set_ylabel('Revenue ($)')
         axes[0].tick_params(axis='x', rotation=45)
 
+        axes[1].clear()
         promo_types = df['promotion_type'].value_counts()
-        axes[1].pie(promo_types.values, labels=promo_types.index, autopct='%1.1f%%', startangle=90)
+        if len(promo_types) > 6:
+            promo_types = pd.concat([promo_types.iloc[:6], pd.Series({'Other': promo_types.iloc[6:].sum()})])
+        axes[1].pie(promo_types.values, labels=promo_types.index, autopct='%1.1f%%', startangle=90,
+                    wedgeprops={'linewidth': 0})
         axes[1].set_title('Promotion Types Distribution', fontsize=12, fontweight='bold')
 
-        plt.tight_layout()
-        canvas = FigureCanvasTkAgg(fig, chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-
-        table_frame = tk.LabelFrame(main_frame, text="Promotion Details", font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
-        table_frame.pack(fill="both", expand=True)
+        self.canvas.draw_idle()
 
         display_cols = ['promotion_name', 'promotion_type', 'start_date', 'end_date', 'total_revenue', 'transactions_count']
-        self.create_data_table(df[display_cols], table_frame)
+        if self.tree is None:
+            self.tree = self.create_data_table(df[display_cols], self.table_frame)
+        else:
+            self.fill_data_table(self.tree, df[display_cols])
 
     def export_pdf(self):
         try:
-            period = self.period_var.get()
-            promotion_type = self.promotion_type_var.get() if self.promotion_type_var.get() != "all" else None
-            status = self.status_var.get() if self.status_var.get() != "all" else None
-
-            if period == "Custom":
-                start_date = self.start_date_picker.get_date()
-                end_date = self.end_date_picker.get_date()
-                df = self.analytics.get_promotion_effectiveness(start_date=start_date, end_date=end_date, promotion_type=promotion_type, status=status)
-            else:
-                days = int(period)
-                df = self.analytics.get_promotion_effectiveness(days=days, promotion_type=promotion_type, status=status)
-
+            df = self._last_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Promotion Effectiveness": df}
                 report_gen.generate_pdf_report("Promotion Effectiveness Report", data_sections)
                 messagebox.showinfo("Export Success", "Promotion effectiveness exported to PDF successfully!")
@@ -1965,20 +2132,9 @@ class PromotionEffectiveness(DataDisplayFrame):
 
     def export_excel(self):
         try:
-            period = self.period_var.get()
-            promotion_type = self.promotion_type_var.get() if self.promotion_type_var.get() != "all" else None
-            status = self.status_var.get() if self.status_var.get() != "all" else None
-
-            if period == "custom":
-                start_date = self.start_date_picker.get_date()
-                end_date = self.end_date_picker.get_date()
-                df = self.analytics.get_promotion_effectiveness(start_date=start_date, end_date=end_date, promotion_type=promotion_type, status=status)
-            else:
-                days = int(period.split('_')[0])
-                df = self.analytics.get_promotion_effectiveness(days=days, promotion_type=promotion_type, status=status)
-
+            df = self._last_df
             if not df.empty:
-                report_gen = ManagerReportGenerator()
+                report_gen = self.get_report_generator()
                 data_sections = {"Promotion Effectiveness": df}
                 report_gen.generate_excel_report("Promotion Effectiveness Report", data_sections)
                 messagebox.showinfo("Export Success", "Promotion effectiveness exported to Excel successfully!")
@@ -1986,6 +2142,3 @@ class PromotionEffectiveness(DataDisplayFrame):
                 messagebox.showwarning("No Data", "No data available to export")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
-
-    def refresh_data(self):
-        self.load_data()
@@ -5,11 +5,40 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
 import io
+import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib import cm
+from matplotlib.colors import hsv_to_rgb
+from matplotlib.figure import Figure
 from tkinter import filedialog, messagebox
 import os
+import xlsxwriter
+
+REPORT_STYLE = dict(plt.style.library['seaborn-v0_8-whitegrid'])
+REPORT_STYLE.update({'path.simplify': True, 'agg.path.chunksize': 10000})
+# Charts are embedded about 7in wide, so 110 dpi already gives ~770px
+CHART_DPI = 110
+PNG_OPTIONS = {'compress_level': 3}
+MAX_PDF_ROWS = 500
+
+@lru_cache(maxsize=None)
+def pie_colors(n):
+    return hsv_to_rgb(np.stack([np.linspace(0, 1, n, endpoint=False), np.full(n, 0.7), np.full(n, 0.9)], axis=1))
+
+def bar_colors(n):
+    return cm.viridis(np.linspace(0.1, 0.9, n))
+
+@lru_cache(maxsize=256)
+def column_label(col):
+    return col.replace('_', ' ').title() if col else ''
+
+@lru_cache(maxsize=64)
+def sheet_name(section_title):
+    return section_title.replace('/', '_').replace('\\', '_')[:31]
 
 class ReportGenerator:
     def __init__(self):
@@ -31,37 +60,67 @@ class ReportGenerator:
             borderPadding=5
         )
         self.normal_style = self.styles['Normal']
+        self._figures = {}
+        self._chart_cache = OrderedDict()
+
+    def _fingerprint(self, df):
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(df.columns.tolist()).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+        return digest.hexdigest()
+
+    def _cached_png(self, key, render, *args):
+        png = self._chart_cache.get(key)
+        if png is None:
+            png = render(*args).getvalue()
+            self._chart_cache[key] = png
+            if len(self._chart_cache) > 16:
+                self._chart_cache.popitem(last=False)
+        else:
+            self._chart_cache.move_to_end(key)
+        return io.BytesIO(png)
+
+    def _get_figure(self, rows, cols, figsize):
+        key = (rows, cols, figsize)
+        fig = self._figures.get(key)
+        if fig is None:
+            fig = Figure(figsize=figsize, facecolor='white')
+            self._figures[key] = fig
+        else:
+            fig.clear()
+        return fig, fig.subplots(rows, cols)
+
+    def create_chart(self, df, chart_type, title, x_col=None, y_col=None, figsize=(8, 4), dpi=CHART_DPI):
+        key = ('chart', chart_type, title, x_col, y_col, figsize, dpi, self._fingerprint(df))
+        return self._cached_png(key, self._render_chart, df, chart_type, title, x_col, y_col, figsize, dpi)
+
+    def _render_chart(self, df, chart_type, title, x_col, y_col, figsize, dpi):
+        with plt.rc_context(REPORT_STYLE):
+            fig, ax = self._get_figure(1, 1, figsize)
 
-    def create_chart(self, df, chart_type, title, x_col=None, y_col=None, figsize=(8, 4)):
-        plt.style.use('seaborn-v0_8-whitegrid')
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        try:
             if chart_type == 'line' and x_col and y_col:
                 ax.plot(df[x_col], df[y_col], marker='o', linewidth=2, markersize=5, color='#3498db')
             elif chart_type == 'bar' and x_col and y_col:
-                sns.barplot(x=x_col, y=y_col, data=df, ax=ax, palette='viridis')
+                ax.bar(df[x_col].to_numpy(), df[y_col].to_numpy(), color=bar_colors(len(df)))
             elif chart_type == 'pie':
                 labels = df.iloc[:, 0]
                 values = df.iloc[:, 1]
-                ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=140, colors=sns.color_palette("husl", len(labels)))
+                ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=140, colors=pie_colors(len(labels)))
                 ax.axis('equal')
 
             ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-            ax.set_xlabel(x_col.replace('_', ' ').title() if x_col else '', fontsize=10)
-            ax.set_ylabel(y_col.replace('_', ' ').title() if y_col else '', fontsize=10)
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            
+            ax.set_xlabel(column_label(x_col), fontsize=10)
+            ax.set_ylabel(column_label(y_col), fontsize=10)
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+            fig.tight_layout()
+
             buffer = io.BytesIO()
-            fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
+            fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight', pil_kwargs=PNG_OPTIONS)
             buffer.seek(0)
-        finally:
-            plt.close(fig)
-        
+
         return buffer
 
-    def generate_pdf_report(self, title, data_sections, charts=None, filename=None):
+    def generate_pdf_report(self, title, data_sections, charts=None, filename=None, notify=True):
         if not filename:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".pdf",
@@ -71,7 +130,7 @@ class ReportGenerator:
         if not filename: return False
             
         try:
-            doc = SimpleDocTemplate(filename, pagesize=A4, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2)
+            doc = SimpleDocTemplate(filename, pagesize=A4, rightMargin=inch/2, leftMargin=inch/2, topMargin=inch/2, bottomMargin=inch/2, pageCompression=1)
             story = []
             
             story.append(Paragraph(title, self.title_style))
@@ -90,11 +149,12 @@ class ReportGenerator:
                 if df.empty: continue
                 story.append(Paragraph(section_title, self.header_style))
                 
-                df_display = df.copy()
-                for col in df_display.select_dtypes(include=['datetime64[ns]']).columns:
-                    df_display[col] = df_display[col].dt.strftime('%Y-%m-%d')
+                total_rows = len(df)
+                df = df.head(MAX_PDF_ROWS)
+                date_cols = df.select_dtypes(include=['datetime64[ns]']).columns
+                df_display = df.assign(**{col: df[col].to_numpy().astype('datetime64[D]').astype(str) for col in date_cols}) if len(date_cols) else df
 
-                data = [df_display.columns.tolist()] + df_display.values.tolist()
+                data = [df_display.columns.tolist()] + [list(row) for row in df_display.itertuples(index=False, name=None)]
                 
                 table = Table(data, hAlign='CENTER')
                 table.setStyle(TableStyle([
@@ -110,17 +170,20 @@ class ReportGenerator:
                     ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#95a5a6"))
                 ]))
                 story.append(table)
+                if total_rows > MAX_PDF_ROWS:
+                    story.append(Paragraph(f"Showing first {MAX_PDF_ROWS:,} of {total_rows:,} rows. Export to Excel for the full data.", self.styles['Italic']))
                 story.append(Spacer(1, 20))
             
             doc.build(story)
-            messagebox.showinfo("Success", f"PDF report saved successfully to {filename}")
+            if notify:
+                messagebox.showinfo("Success", f"PDF report saved successfully to {filename}")
             return True
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate PDF report: {e}")
             return False
     
-    def generate_excel_report(self, title, data_sections, filename=None):
+    def generate_excel_report(self, title, data_sections, filename=None, notify=True):
         if not filename:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".xlsx",
@@ -130,16 +193,28 @@ class ReportGenerator:
         if not filename: return False
             
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                summary_data = {'Report Title': [title], 'Generated On': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')], 'Sections': [', '.join(data_sections.keys())]}
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True, 'nan_inf_to_errors': True,
+                                                      'default_date_format': 'yyyy-mm-dd hh:mm:ss', 'remove_timezone': True})
+            try:
+                header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+                ws = workbook.add_worksheet('Summary')
+                ws.write_row(0, 0, ['Report Title', 'Generated On', 'Sections'], header_format)
+                ws.write_row(1, 0, [title, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), ', '.join(data_sections.keys())])
                 
                 for section_title, df in data_sections.items():
-                    if not df.empty:
-                        sheet_name = section_title.replace('/', '_').replace('\\', '_')[:31]
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+                    if df.empty: continue
+                    # NaT cannot be written as a date, so blank out missing cells first
+                    if df.isna().to_numpy().any():
+                        df = df.astype(object).where(df.notna(), None)
+                    ws = workbook.add_worksheet(sheet_name(section_title))
+                    ws.write_row(0, 0, df.columns.tolist(), header_format)
+                    for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+                        ws.write_row(row_num, 0, row)
+            finally:
+                workbook.close()
             
-            messagebox.showinfo("Success", f"Excel report saved successfully to {filename}")
+            if notify:
+                messagebox.showinfo("Success", f"Excel report saved successfully to {filename}")
             return True
             
         except Exception as e:
@@ -149,112 +224,112 @@ class ReportGenerator:
 class ManagerReportGenerator(ReportGenerator):
     def _create_traffic_analysis_chart(self, df):
         if df.empty: return None
-        plt.style.use('seaborn-v0_8-whitegrid')
-        fig, axes = plt.subplots(2, 2, figsize=(12, 8), facecolor='white')
-        fig.suptitle('Customer Traffic Analysis', fontsize=16, fontweight='bold')
-
-        plot_details = [
-            (axes[0, 0], 'transaction_count', 'Transaction Volume'),
-            (axes[0, 1], 'items_sold', 'Items Sold'),
-            (axes[1, 0], 'total_revenue', 'Revenue Performance'),
-            (axes[1, 1], 'avg_transaction_value', 'Avg Transaction Value')
-        ]
-
-        for ax, y_col, title in plot_details:
-            ax.plot(df['period_label'], df[y_col], marker='o', linestyle='-', color='#3498db')
-            ax.set_title(title, fontsize=12)
-            ax.tick_params(axis='x', rotation=45, labelsize=8)
-            ax.grid(True, linestyle='--', alpha=0.6)
-
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
-        buffer = io.BytesIO()
-        fig.savefig(buffer, format='png', dpi=300)
-        buffer.seek(0)
-        plt.close(fig)
-        return buffer
+        return self._cached_png(('traffic', self._fingerprint(df)), self._render_traffic_analysis_chart, df)
+
+    def _render_traffic_analysis_chart(self, df):
+        with plt.rc_context(REPORT_STYLE):
+            fig, axes = self._get_figure(2, 2, (12, 8))
+            fig.suptitle('Customer Traffic Analysis', fontsize=16, fontweight='bold')
+
+            plot_details = [
+                (axes[0, 0], 'transaction_count', 'Transaction Volume'),
+                (axes[0, 1], 'items_sold', 'Items Sold'),
+                (axes[1, 0], 'total_revenue', 'Revenue Performance'),
+                (axes[1, 1], 'avg_transaction_value', 'Avg Transaction Value')
+            ]
+
+            for ax, y_col, title in plot_details:
+                ax.plot(df['period_label'], df[y_col], marker='o', linestyle='-', color='#3498db')
+                ax.set_title(title, fontsize=12)
+                ax.tick_params(axis='x', rotation=45, labelsize=8)
+                ax.grid(True, linestyle='--', alpha=0.6)
+
+            fig.tight_layout(rect=[0, 0, 1, 0.96])
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=CHART_DPI, pil_kwargs=PNG_OPTIONS)
+            buffer.seek(0)
+            return buffer
 
     def _create_promotion_effectiveness_chart(self, df):
         if df.empty: return None
-        plt.style.use('seaborn-v0_8-whitegrid')
-        fig, axes = plt.subplots(1, 2, figsize=(12, 5), facecolor='white')
-        fig.suptitle('Promotion Effectiveness', fontsize=16, fontweight='bold')
-
-        top_promos = df.nlargest(8, 'total_revenue')
-        sns.barplot(x='promotion_name', y='total_revenue', data=top_promos, ax=axes[0], palette='mako')
-        axes[0].set_title('Revenue by Promotion', fontsize=12)
-        axes[0].tick_params(axis='x', rotation=45, ha='right')
-
-        promo_types = df['promotion_type'].value_counts()
-        axes[1].pie(promo_types.values, labels=promo_types.index, autopct='%1.1f%%', startangle=140, colors=sns.color_palette("husl", len(promo_types)))
-        axes[1].set_title('Promotion Types Distribution', fontsize=12)
-
-        plt.tight_layout(rect=[0, 0, 1, 0.95])
-        buffer = io.BytesIO()
-        fig.savefig(buffer, format='png', dpi=300)
-        buffer.seek(0)
-        plt.close(fig)
-        return buffer
+        return self._cached_png(('promotions', self._fingerprint(df)), self._render_promotion_effectiveness_chart, df)
+
+    def _render_promotion_effectiveness_chart(self, df):
+        with plt.rc_context(REPORT_STYLE):
+            fig, axes = self._get_figure(1, 2, (12, 5))
+            fig.suptitle('Promotion Effectiveness', fontsize=16, fontweight='bold')
+
+            top_promos = df.nlargest(8, 'total_revenue')
+            axes[0].bar(top_promos['promotion_name'].to_numpy(), top_promos['total_revenue'].to_numpy(), color=bar_colors(len(top_promos)))
+            axes[0].set_title('Revenue by Promotion', fontsize=12)
+            plt.setp(axes[0].get_xticklabels(), rotation=45, ha='right')
+
+            promo_types = df['promotion_type'].value_counts()
+            axes[1].pie(promo_types.values, labels=promo_types.index, autopct='%1.1f%%', startangle=140, colors=pie_colors(len(promo_types)))
+            axes[1].set_title('Promotion Types Distribution', fontsize=12)
+
+            fig.tight_layout(rect=[0, 0, 1, 0.95])
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=CHART_DPI, pil_kwargs=PNG_OPTIONS)
+            buffer.seek(0)
+            return buffer
+
+    # (analytics key, report section, chart title, chart renderer)
+    SECTIONS = (
+        ('sales_trend', 'Sales Trend Analysis', 'Sales Trend Chart',
+         lambda gen, df: gen.create_chart(df, 'line', 'Daily Revenue Trend', 'date', 'daily_revenue')),
+        ('top_products', 'Top Selling Products', 'Top Products Chart',
+         lambda gen, df: gen.create_chart(df.head(10), 'bar', 'Top 10 Products by Quantity Sold', 'product_name', 'total_quantity_sold')),
+        ('customer_traffic', 'Customer Traffic Analysis', 'Customer Traffic Chart', _create_traffic_analysis_chart),
+        ('inventory', 'Inventory Usage Insights', None, None),
+        ('promotions', 'Promotion Effectiveness', 'Promotion Effectiveness Chart', _create_promotion_effectiveness_chart),
+    )
 
     def generate_comprehensive_report(self, analytics_data, format_type='pdf'):
         title = "Manager Analytics Report"
         data_sections, charts = {}, {}
+        need_charts = format_type == 'pdf'
         
-        if 'sales_trend' in analytics_data and not analytics_data['sales_trend'].empty:
-            df = analytics_data['sales_trend']
-            data_sections['Sales Trend Analysis'] = df
-            charts['Sales Trend Chart'] = self.create_chart(df, 'line', 'Daily Revenue Trend', 'date', 'daily_revenue')
-        
-        if 'top_products' in analytics_data and not analytics_data['top_products'].empty:
-            df = analytics_data['top_products']
-            data_sections['Top Selling Products'] = df
-            charts['Top Products Chart'] = self.create_chart(df.head(10), 'bar', 'Top 10 Products by Quantity Sold', 'product_name', 'total_quantity_sold')
-        
-        if 'customer_traffic' in analytics_data and not analytics_data['customer_traffic'].empty:
-            df = analytics_data['customer_traffic']
-            data_sections['Customer Traffic Analysis'] = df
-            charts['Customer Traffic Chart'] = self._create_traffic_analysis_chart(df)
-        
-        if 'inventory' in analytics_data and not analytics_data['inventory'].empty:
-            data_sections['Inventory Usage Insights'] = analytics_data['inventory']
-        
-        if 'promotions' in analytics_data and not analytics_data['promotions'].empty:
-            df = analytics_data['promotions']
-            data_sections['Promotion Effectiveness'] = df
-            charts['Promotion Effectiveness Chart'] = self._create_promotion_effectiveness_chart(df)
+        for key, section_title, chart_title, render in self.SECTIONS:
+            df = analytics_data.get(key)
+            if df is None or df.empty: continue
+            data_sections[section_title] = df
+            if need_charts and render:
+                charts[chart_title] = render(self, df)
 
         if 'product_trends' in analytics_data and not analytics_data['product_trends'].empty:
             df = analytics_data['product_trends']
-            data_sections['Product Sales Trends'] = df.drop(columns=['total_quantity', 'avg_daily_quantity', 'days_with_sales']).drop_duplicates()
-
-            products = df['product_name'].unique()[:5]
-
-            fig_qty, ax_qty = plt.subplots(figsize=(10, 5))
-            for product in products:
-                product_data = df[df['product_name'] == product]
-                ax_qty.plot(product_data['sale_date'], product_data['daily_quantity'], marker='o', label=product)
-            ax_qty.set_title('Daily Quantity Sold - Top 5 Products')
-            ax_qty.legend()
-            ax_qty.grid(True)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            qty_buffer = io.BytesIO()
-            fig_qty.savefig(qty_buffer, format='png')
-            plt.close(fig_qty)
-            charts['Daily Quantity Trends'] = qty_buffer
-
-            fig_rev, ax_rev = plt.subplots(figsize=(10, 5))
-            for product in products:
-                product_data = df[df['product_name'] == product]
-                ax_rev.plot(product_data['sale_date'], product_data['daily_revenue'], marker='s', label=product)
-            ax_rev.set_title('Daily Revenue - Top 5 Products')
-            ax_rev.legend()
-            ax_rev.grid(True)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            rev_buffer = io.BytesIO()
-            fig_rev.savefig(rev_buffer, format='png')
-            plt.close(fig_rev)
-            charts['Daily Revenue Trends'] = rev_buffer
+            keep_cols = [c for c in df.columns if c not in ('total_quantity', 'avg_daily_quantity', 'days_with_sales')]
+            data_sections['Product Sales Trends'] = df.drop_duplicates(subset=keep_cols)[keep_cols]
+
+            if need_charts:
+                products = df['product_name'].drop_duplicates().head(5)
+                grouped = df[df['product_name'].isin(products)].groupby('product_name', sort=False)
+
+                with plt.rc_context(REPORT_STYLE):
+                    fig_qty, ax_qty = self._get_figure(1, 1, (10, 5))
+                    for product, product_data in grouped:
+                        ax_qty.plot(product_data['sale_date'], product_data['daily_quantity'], marker='o', label=product)
+                    ax_qty.set_title('Daily Quantity Sold - Top 5 Products')
+                    ax_qty.legend()
+                    ax_qty.grid(True)
+                    ax_qty.tick_params(axis='x', rotation=45)
+                    fig_qty.tight_layout()
+                    qty_buffer = io.BytesIO()
+                    fig_qty.savefig(qty_buffer, format='png', dpi=CHART_DPI, pil_kwargs=PNG_OPTIONS)
+                    charts['Daily Quantity Trends'] = qty_buffer
+
+                    fig_rev, ax_rev = self._get_figure(1, 1, (10, 5))
+                    for product, product_data in grouped:
+                        ax_rev.plot(product_data['sale_date'], product_data['daily_revenue'], marker='s', label=product)
+                    ax_rev.set_title('Daily Revenue - Top 5 Products')
+                    ax_rev.legend()
+                    ax_rev.grid(True)
+                    ax_rev.tick_params(axis='x', rotation=45)
+                    fig_rev.tight_layout()
+                    rev_buffer = io.BytesIO()
+                    fig_rev.savefig(rev_buffer, format='png', dpi=CHART_DPI, pil_kwargs=PNG_OPTIONS)
+                    charts['Daily Revenue Trends'] = rev_buffer
 
         if format_type == 'pdf':
             return self.generate_pdf_report(title, data_sections, charts)
@@ -265,6 +340,7 @@ class SalesManagerReportGenerator(ReportGenerator):
     def generate_sales_report(self, analytics_data, format_type='pdf'):
         title = "Sales Manager Analytics Report"
         data_sections, charts = {}, {}
+        need_charts = format_type == 'pdf'
         
         if 'dashboard' in analytics_data and not analytics_data['dashboard'].empty:
             data_sections['Today\'s Sales Dashboard'] = analytics_data['dashboard']
@@ -276,7 +352,8 @@ class SalesManagerReportGenerator(ReportGenerator):
         if 'customer_behavior' in analytics_data and not analytics_data['customer_behavior'].empty:
             df = analytics_data['customer_behavior']
             data_sections['Customer Buying Behavior'] = df
-            charts['Customer Behavior Chart'] = self.create_chart(df, 'pie', 'Revenue by Customer Type')
+            if need_charts:
+                charts['Customer Behavior Chart'] = self.create_chart(df, 'pie', 'Revenue by Customer Type')
         
         if 'popular_products' in analytics_data and not analytics_data['popular_products'].empty:
             data_sections['Popular Products for Promotion'] = analytics_data['popular_products']
@@ -284,7 +361,8 @@ class SalesManagerReportGenerator(ReportGenerator):
         if 'seasonal' in analytics_data and not analytics_data['seasonal'].empty:
             df = analytics_data['seasonal']
             data_sections['Seasonal Sales Trends'] = df
-            charts['Seasonal Trends Chart'] = self.create_chart(df, 'line', 'Monthly Revenue Trends', 'month', 'monthly_revenue')
+            if need_charts:
+                charts['Seasonal Trends Chart'] = self.create_chart(df, 'line', 'Monthly Revenue Trends', 'month', 'monthly_revenue')
         
         if format_type == 'pdf':
             return self.generate_pdf_report(title, data_sections, charts)
@@ -295,6 +373,7 @@ class RestockerReportGenerator(ReportGenerator):
     def generate_inventory_report(self, analytics_data, format_type='pdf'):
         title = "Inventory Management Report"
         data_sections, charts = {}, {}
+        need_charts = format_type == 'pdf'
         
         if 'low_stock' in analytics_data and not analytics_data['low_stock'].empty:
             data_sections['Low Stock Products'] = analytics_data['low_stock']
@@ -305,7 +384,8 @@ class RestockerReportGenerator(ReportGenerator):
         if 'movement_trends' in analytics_data and not analytics_data['movement_trends'].empty:
             df = analytics_data['movement_trends']
             data_sections['Inventory Movement by Category'] = df
-            charts['Movement Trends Chart'] = self.create_chart(df, 'bar', 'Inventory Outbound by Category', 'category', 'total_outbound')
+            if need_charts:
+                charts['Movement Trends Chart'] = self.create_chart(df, 'bar', 'Inventory Outbound by Category', 'category', 'total_outbound')
         
         if format_type == 'pdf':
             return self.generate_pdf_report(title, data_sections, charts)
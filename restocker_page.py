@@ -1,22 +1,45 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from collections import OrderedDict
+from itertools import islice
+import time
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
-from analytics_engine import RestockerAnalytics
-import seaborn as sns
+from matplotlib.figure import Figure
+import numpy as np
+from analytics_engine import RestockerAnalytics, QueryError
 
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+STATUS_LABELS = {'Out of Stock': '🔴 Out of Stock', 'Critical': '🟠 Critical', 'Low': '🟡 Low'}
+TABLE_PAGE_SIZE = 200
+MAX_CHART_CATEGORIES = 20
+_styled = False
+
+
+def ensure_chart_style():
+    global _styled
+    if not _styled:
+        import seaborn as sns
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _styled = True
 
 
 class RestockerDataFrame(tk.Frame):
+    # Shared by every tab so switching back and forth reuses recent results
+    _query_cache = OrderedDict()
+    CACHE_TTL = 60
+    main_frame = None
 
-    def __init__(self, master, title):
+    def __init__(self, master, title, analytics, executor):
         super().__init__(master, bg="#f0f0f0")
         self.title = title
-        self.analytics = RestockerAnalytics()
+        self.analytics = analytics
+        self._executor = executor
+        self._pending_future = None
         self.create_header()
+        self.busy_label = tk.Label(self, text="⏳ Loading data...",
+                                   font=("Segoe UI", 11), bg="#f0f0f0", fg="#2c3e50")
 
     def create_header(self):
         header_frame = tk.Frame(self, bg="#f0f0f0")
@@ -39,11 +62,94 @@ class RestockerDataFrame(tk.Frame):
                   font=("Segoe UI", 9), relief="flat", padx=10).pack(side="right", padx=5)
 
     def refresh_data(self):
-        for widget in self.winfo_children():
-            if widget != self.winfo_children()[0]:
+        RestockerDataFrame._query_cache.clear()
+        self.clear_view()
+        self.load_data()
+
+    def clear_view(self):
+        # Keep the header and the loading label; a tab's reusable main_frame is only hidden
+        for widget in self.winfo_children()[2:]:
+            if widget is self.main_frame:
+                widget.pack_forget()
+            else:
                 widget.destroy()
 
-        self.load_data()
+    def load_data(self):
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+
+        key, fetch, args = self.query()
+        if self.is_cached(key):
+            self.busy_label.pack_forget()
+            self.display_data(self.cached_query(key, fetch, *args))
+            return
+
+        self.busy_label.pack(pady=10)
+        future = self._executor.submit(fetch, *args)
+        self._pending_future = future
+        future.add_done_callback(lambda f: self._schedule_render(f, key))
+
+    def _schedule_render(self, future, key):
+        try:
+            self.after(0, self._on_data_loaded, future, key)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _on_data_loaded(self, future, key):
+        if future is not self._pending_future or future.cancelled():
+            return
+        self._pending_future = None
+        self.busy_label.pack_forget()
+
+        try:
+            df = self.cached_query(key, future.result)
+        except QueryError as e:
+            messagebox.showerror(e.title, str(e))
+            self.show_error()
+            return
+        except Exception as e:
+            print(f"Error loading {self.title}: {e}")
+            self.show_error()
+            return
+        self.display_data(df)
+
+    def destroy(self):
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+            self._pending_future = None
+        super().destroy()
+
+    def show_error(self):
+        error_frame = tk.Frame(self, bg="#f8d7da", relief="solid", bd=1)
+        error_frame.pack(fill="both", expand=True, padx=20, pady=50)
+
+        tk.Label(error_frame, text="⚠️ Connection Error",
+                 font=("Segoe UI", 20, "bold"), bg="#f8d7da", fg="#721c24").pack(pady=20)
+        tk.Label(error_frame, text=self.error_message,
+                 font=("Segoe UI", 12), bg="#f8d7da", fg="#721c24").pack(pady=10)
+
+        retry_button = tk.Button(error_frame, text="🔄 Retry",
+                                 command=self.refresh_data, bg="#dc3545", fg="white",
+                                 font=("Segoe UI", 11), relief="flat", padx=20)
+        retry_button.pack(pady=10)
+
+    def is_cached(self, key):
+        entry = self._query_cache.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.CACHE_TTL
+
+    def cached_query(self, key, fetch, *args, **kwargs):
+        if self.is_cached(key):
+            self._query_cache.move_to_end(key)
+            return self._query_cache[key][1].copy(deep=False)
+        df = fetch(*args, **kwargs)
+        if df.empty:
+            return df
+        self._query_cache[key] = (time.monotonic(), df)
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > 16:
+            self._query_cache.popitem(last=False)
+        return df.copy(deep=False)
 
     def create_data_table(self, df, parent_frame):
         if df.empty:
@@ -54,12 +160,11 @@ class RestockerDataFrame(tk.Frame):
         tree_frame = tk.Frame(parent_frame)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
+        # Packed only after the rows are in, so Tk lays the table out once
         tree = ttk.Treeview(tree_frame)
-        tree.pack(side="left", fill="both", expand=True)
 
         v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=tree.yview)
         v_scrollbar.pack(side="right", fill="y")
-        tree.configure(yscrollcommand=v_scrollbar.set)
 
         h_scrollbar = ttk.Scrollbar(parent_frame, orient="horizontal", command=tree.xview)
         h_scrollbar.pack(side="bottom", fill="x")
@@ -72,37 +177,51 @@ class RestockerDataFrame(tk.Frame):
             tree.heading(col, text=col.replace('_', ' ').title())
             tree.column(col, width=120, anchor="center")
 
-        for index, row in df.iterrows():
-            values = [str(val)[:50] + "..." if len(str(val)) > 50 else str(val) for val in row]
-            item_id = tree.insert("", "end", values=values)
-
-            if 'stock_status' in df.columns:
-                status = row['stock_status']
-                if status == 'Out of Stock':
-                    tree.set(item_id, 'stock_status', '🔴 Out of Stock')
-                elif status == 'Critical':
-                    tree.set(item_id, 'stock_status', '🟠 Critical')
-                elif status == 'Low':
-                    tree.set(item_id, 'stock_status', '🟡 Low')
+        if 'stock_status' in df.columns:
+            status = df['stock_status'].astype(str)
+            df = df.assign(stock_status=status.map(STATUS_LABELS).fillna(status))
+
+        # Rows are inserted a page at a time as the user scrolls towards the end
+        rows = df.itertuples(index=False, name=None)
+        state = {'done': False, 'pending': False}
+
+        def load_more():
+            state['pending'] = False
+            inserted = 0
+            for row in islice(rows, TABLE_PAGE_SIZE):
+                values = [text[:50] + "..." if len(text) > 50 else text for text in map(str, row)]
+                tree.insert("", "end", values=values)
+                inserted += 1
+            state['done'] = inserted < TABLE_PAGE_SIZE
+
+        def on_scroll(first, last):
+            v_scrollbar.set(first, last)
+            if float(last) > 0.9 and not state['done'] and not state['pending']:
+                state['pending'] = True
+                tree.after_idle(load_more)
+
+        load_more()
+        tree.configure(yscrollcommand=on_scroll)
+        tree.pack(side="left", fill="both", expand=True)
 
         return tree
 
     def export_report(self):
         messagebox.showinfo("Export", "Report export - override in child class")
 
-    def refresh_data(self):
-        messagebox.showinfo("Refresh", "Data refreshed!")
-
 
 class LowStock(RestockerDataFrame):
-    def __init__(self, master):
-        super().__init__(master, "Low Stock Product Reports")
+    error_message = "Unable to load inventory data. Please check your connection and try again."
+
+    def __init__(self, master, analytics, executor):
+        super().__init__(master, "Low Stock Product Reports", analytics, executor)
         self.load_data()
 
-    def load_data(self):
-        try:
-            df = self.analytics.get_low_stock_products()
+    def query(self):
+        return ('low_stock',), self.analytics.get_low_stock_products, ()
 
+    def display_data(self, df):
+        try:
             if not df.empty:
                 main_frame = tk.Frame(self, bg="#f0f0f0")
                 main_frame.pack(fill="both", expand=True)
@@ -110,9 +229,10 @@ class LowStock(RestockerDataFrame):
                 alert_frame = tk.Frame(main_frame, bg="#f8d7da", relief="solid", bd=1)
                 alert_frame.pack(fill="x", padx=10, pady=5)
 
-                out_of_stock = len(df[df['stock_status'] == 'Out of Stock'])
-                critical = len(df[df['stock_status'] == 'Critical'])
-                low = len(df[df['stock_status'] == 'Low'])
+                counts = df['stock_status'].value_counts().to_dict()
+                out_of_stock = int(counts.get('Out of Stock', 0))
+                critical = int(counts.get('Critical', 0))
+                low = int(counts.get('Low', 0))
 
                 alert_text = f"🚨 INVENTORY ALERTS: {out_of_stock} Out of Stock | {critical} Critical | {low} Low Stock"
                 tk.Label(alert_frame, text=alert_text, font=("Segoe UI", 12, "bold"),
@@ -129,10 +249,10 @@ class LowStock(RestockerDataFrame):
                                                      font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
                     suggestion_frame.pack(fill="x", padx=10, pady=5)
 
-                    urgent_items = df[df['stock_status'].isin(['Out of Stock', 'Critical'])].head(3)
+                    urgent_items = df.loc[df['stock_status'] <= 'Critical', ['product_name', 'current_stock', 'reorder_level']].head(3)
                     if not urgent_items.empty:
-                        for _, item in urgent_items.iterrows():
-                            suggestion_text = f"📦 {item['product_name']} - Current: {item['current_stock']}, Reorder Level: {item['reorder_level']}"
+                        for product_name, current_stock, reorder_level in urgent_items.itertuples(index=False, name=None):
+                            suggestion_text = f"📦 {product_name} - Current: {current_stock}, Reorder Level: {reorder_level}"
                             tk.Label(suggestion_frame, text=suggestion_text,
                                      font=("Segoe UI", 10), bg="#f0f0f0").pack(anchor="w", padx=10, pady=2)
             else:
@@ -145,22 +265,12 @@ class LowStock(RestockerDataFrame):
                          font=("Segoe UI", 14), bg="#d4edda", fg="#155724").pack()
         except Exception as e:
             print(f"Error loading low stock data: {e}")
-            error_frame = tk.Frame(self, bg="#f8d7da", relief="solid", bd=1)
-            error_frame.pack(fill="both", expand=True, padx=20, pady=50)
-
-            tk.Label(error_frame, text="⚠️ Connection Error",
-                     font=("Segoe UI", 20, "bold"), bg="#f8d7da", fg="#721c24").pack(pady=20)
-            tk.Label(error_frame, text="Unable to load inventory data. Please check your connection and try again.",
-                     font=("Segoe UI", 12), bg="#f8d7da", fg="#721c24").pack(pady=10)
-
-            retry_button = tk.Button(error_frame, text="🔄 Retry",
-                                     command=self.refresh_data, bg="#dc3545", fg="white",
-                                     font=("Segoe UI", 11), relief="flat", padx=20)
-            retry_button.pack(pady=10)
+            self.show_error()
 
     def export_report(self):
         try:
-            df = self.analytics.get_low_stock_products()
+            key, fetch, args = self.query()
+            df = self.cached_query(key, fetch, *args)
             if not df.empty:
                 from report_generator import RestockerReportGenerator
                 report_gen = RestockerReportGenerator()
@@ -172,72 +282,82 @@ class LowStock(RestockerDataFrame):
 
 
 class InventoryTrends(RestockerDataFrame):
-    def __init__(self, master):
-        super().__init__(master, "Inventory Movement Trends")
+    error_message = "Unable to load inventory trends. Please check your connection and try again."
+
+    def __init__(self, master, analytics, executor):
+        super().__init__(master, "Inventory Movement Trends", analytics, executor)
         self.load_data()
 
-    def load_data(self):
-        try:
-            df = self.analytics.get_inventory_movement_trends(30)
+    def build_view(self):
+        ensure_chart_style()
+        self.main_frame = tk.Frame(self, bg="#f0f0f0")
+        chart_frame = tk.Frame(self.main_frame, bg="white", relief="solid", bd=1)
+        chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-            if not df.empty:
-                main_frame = tk.Frame(self, bg="#f0f0f0")
-                main_frame.pack(fill="both", expand=True)
-                chart_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
-                chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
-                fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6), facecolor='white')
+        self.fig = Figure(figsize=(14, 6), facecolor='white')
+        self.ax1, self.ax2 = self.fig.subplots(1, 2)
+        self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.table_frame = tk.LabelFrame(self.main_frame, text="Movement Data by Category",
+                                         font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
+        self.table_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-                ax1.bar(df['category'], df['total_outbound'], color='#e74c3c', alpha=0.8)
+    def query(self):
+        return ('movement_trends', 30), self.analytics.get_inventory_movement_trends, (30,)
+
+    def display_data(self, df):
+        try:
+            if not df.empty:
+                if self.main_frame is None:
+                    self.build_view()
+                self.main_frame.pack(fill="both", expand=True)
+                ax1, ax2 = self.ax1, self.ax2
+                ax1.clear()
+                ax2.clear()
+
+                # The table below keeps every category; the charts show the busiest ones
+                plot_df = df.nlargest(MAX_CHART_CATEGORIES, 'total_outbound') if len(df) > MAX_CHART_CATEGORIES else df
+                categories = plot_df['category'].to_numpy()
+                inbound = plot_df['total_inbound'].to_numpy()
+                outbound = plot_df['total_outbound'].to_numpy()
+
+                ax1.bar(categories, outbound, color='#e74c3c', alpha=0.8)
                 ax1.set_title('Products Sold by Category')
                 ax1.set_xlabel('Category')
                 ax1.set_ylabel('Total Units Sold')
                 ax1.tick_params(axis='x', rotation=45)
 
-                x_pos = range(len(df))
+                x_pos = np.arange(len(plot_df))
                 width = 0.35
-                ax2.bar([p - width / 2 for p in x_pos], df['total_inbound'], width,
+                ax2.bar(x_pos - width / 2, inbound, width,
                         label='Inbound', color='#27ae60', alpha=0.8)
-                ax2.bar([p + width / 2 for p in x_pos], df['total_outbound'], width,
+                ax2.bar(x_pos + width / 2, outbound, width,
                         label='Outbound', color='#e74c3c', alpha=0.8)
                 ax2.set_title('Inventory Flow by Category')
                 ax2.set_xlabel('Category')
                 ax2.set_ylabel('Units')
                 ax2.set_xticks(x_pos)
-                ax2.set_xticklabels(df['category'], rotation=45)
+                ax2.set_xticklabels(categories, rotation=45)
                 ax2.legend()
 
-                plt.tight_layout()
-
-                canvas = FigureCanvasTkAgg(fig, chart_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-
-                table_frame = tk.LabelFrame(main_frame, text="Movement Data by Category",
-                                            font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
-                table_frame.pack(fill="both", expand=True, padx=10, pady=5)
+                self.fig.tight_layout()
+                self.canvas.draw_idle()
 
-                self.create_data_table(df, table_frame)
+                for widget in self.table_frame.winfo_children():
+                    widget.destroy()
+                self.create_data_table(df, self.table_frame)
             else:
                 tk.Label(self, text="No inventory movement data available",
                          font=("Segoe UI", 16), bg="#f0f0f0").pack(expand=True)
         except Exception as e:
             print(f"Error loading inventory trends: {e}")
-            error_frame = tk.Frame(self, bg="#f8d7da", relief="solid", bd=1)
-            error_frame.pack(fill="both", expand=True, padx=20, pady=50)
-
-            tk.Label(error_frame, text="⚠️ Connection Error",
-                     font=("Segoe UI", 20, "bold"), bg="#f8d7da", fg="#721c24").pack(pady=20)
-            tk.Label(error_frame, text="Unable to load inventory trends. Please check your connection and try again.",
-                     font=("Segoe UI", 12), bg="#f8d7da", fg="#721c24").pack(pady=10)
-
-            retry_button = tk.Button(error_frame, text="🔄 Retry",
-                                     command=self.refresh_data, bg="#dc3545", fg="white",
-                                     font=("Segoe UI", 11), relief="flat", padx=20)
-            retry_button.pack(pady=10)
+            self.show_error()
 
     def export_report(self):
         try:
-            df = self.analytics.get_inventory_movement_trends(30)
+            key, fetch, args = self.query()
+            df = self.cached_query(key, fetch, *args)
             if not df.empty:
                 from report_generator import RestockerReportGenerator
                 report_gen = RestockerReportGenerator()
@@ -249,40 +369,62 @@ class InventoryTrends(RestockerDataFrame):
 
 
 class ForecastDemand(RestockerDataFrame):
-    def __init__(self, master):
-        super().__init__(master, "High Demand Product Forecasts")
+    error_message = "Unable to load demand forecast data. Please check your connection and try again."
+
+    def __init__(self, master, analytics, executor):
+        super().__init__(master, "High Demand Product Forecasts", analytics, executor)
         self.load_data()
 
-    def load_data(self):
-        try:
-            df = self.analytics.get_predicted_high_demand_products(30)
+    def build_view(self):
+        ensure_chart_style()
+        self.main_frame = tk.Frame(self, bg="#f0f0f0")
 
-            if not df.empty:
-                main_frame = tk.Frame(self, bg="#f0f0f0")
-                main_frame.pack(fill="both", expand=True)
+        risk_frame = tk.Frame(self.main_frame, bg="#fff3cd", relief="solid", bd=1)
+        risk_frame.pack(fill="x", padx=10, pady=5)
+        self.risk_label = tk.Label(risk_frame, font=("Segoe UI", 12, "bold"),
+                                   bg="#fff3cd", fg="#856404")
+        self.risk_label.pack(pady=10)
+
+        self.chart_frame = tk.Frame(self.main_frame, bg="white", relief="solid", bd=1)
+        self.fig = Figure(figsize=(12, 6), facecolor='white')
+        self.ax = self.fig.subplots()
+        self.canvas = FigureCanvasTkAgg(self.fig, self.chart_frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
+
+        self.table_frame = tk.LabelFrame(self.main_frame, text="Demand Forecast Data",
+                                         font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
+        self.table_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-                risk_frame = tk.Frame(main_frame, bg="#fff3cd", relief="solid", bd=1)
-                risk_frame.pack(fill="x", padx=10, pady=5)
+    def query(self):
+        return ('high_demand', 30), self.analytics.get_predicted_high_demand_products, (30,)
 
-                high_risk = len(df[df['demand_risk'] == 'High Demand Risk'])
-                medium_risk = len(df[df['demand_risk'] == 'Medium Demand Risk'])
-                low_risk = len(df[df['demand_risk'] == 'Low Demand Risk'])
+    def display_data(self, df):
+        try:
+            if not df.empty:
+                if self.main_frame is None:
+                    self.build_view()
+                self.main_frame.pack(fill="both", expand=True)
+
+                counts = df['demand_risk'].value_counts().to_dict()
+                high_risk = int(counts.get('High Demand Risk', 0))
+                medium_risk = int(counts.get('Medium Demand Risk', 0))
+                low_risk = int(counts.get('Low Demand Risk', 0))
 
                 risk_text = f"⚠️ DEMAND FORECAST: {high_risk} High Risk | {medium_risk} Medium Risk | {low_risk} Low Risk"
-                tk.Label(risk_frame, text=risk_text, font=("Segoe UI", 12, "bold"),
-                         bg="#fff3cd", fg="#856404").pack(pady=10)
+                self.risk_label.config(text=risk_text)
 
                 if high_risk > 0:
-                    chart_frame = tk.Frame(main_frame, bg="white", relief="solid", bd=1)
-                    chart_frame.pack(fill="both", expand=True, padx=10, pady=5)
+                    self.chart_frame.pack(fill="both", expand=True, padx=10, pady=5, before=self.table_frame)
 
                     high_risk_items = df[df['demand_risk'] == 'High Demand Risk'].head(5)
 
-                    fig, ax = plt.subplots(figsize=(12, 6), facecolor='white')
-                    bars = ax.bar(high_risk_items['product_name'], high_risk_items['current_stock'],
-                                  color='#e74c3c', alpha=0.8, label='Current Stock')
-                    ax.bar(high_risk_items['product_name'], high_risk_items['suggested_reorder_quantity'],
-                           bottom=high_risk_items['current_stock'], color='#27ae60', alpha=0.8,
+                    ax = self.ax
+                    ax.clear()
+                    names = high_risk_items['product_name'].to_numpy()
+                    current = high_risk_items['current_stock'].to_numpy()
+                    reorder = high_risk_items['suggested_reorder_quantity'].to_numpy()
+                    ax.bar(names, current, color='#e74c3c', alpha=0.8, label='Current Stock')
+                    ax.bar(names, reorder, bottom=current, color='#27ae60', alpha=0.8,
                            label='Suggested Reorder')
 
                     ax.set_title('High Risk Products - Current vs Suggested Stock')
@@ -290,39 +432,25 @@ class ForecastDemand(RestockerDataFrame):
                     ax.set_ylabel('Units')
                     ax.legend()
                     ax.tick_params(axis='x', rotation=45)
-                    plt.tight_layout()
-
-                    canvas = FigureCanvasTkAgg(fig, chart_frame)
-                    canvas.draw()
-                    canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
-
-                table_frame = tk.LabelFrame(main_frame, text="Demand Forecast Data",
-                                            font=("Segoe UI", 12, "bold"), bg="#f0f0f0")
-                table_frame.pack(fill="both", expand=True, padx=10, pady=5)
-
-                self.create_data_table(df, table_frame)
+                    self.fig.tight_layout()
+                    self.canvas.draw_idle()
+                else:
+                    self.chart_frame.pack_forget()
+
+                for widget in self.table_frame.winfo_children():
+                    widget.destroy()
+                self.create_data_table(df, self.table_frame)
             else:
                 tk.Label(self, text="Insufficient sales data for demand forecasting",
                          font=("Segoe UI", 16), bg="#f0f0f0").pack(expand=True)
         except Exception as e:
             print(f"Error loading demand forecast: {e}")
-            error_frame = tk.Frame(self, bg="#f8d7da", relief="solid", bd=1)
-            error_frame.pack(fill="both", expand=True, padx=20, pady=50)
-
-            tk.Label(error_frame, text="⚠️ Connection Error",
-                     font=("Segoe UI", 20, "bold"), bg="#f8d7da", fg="#721c24").pack(pady=20)
-            tk.Label(error_frame,
-                     text="Unable to load demand forecast data. Please check your connection and try again.",
-                     font=("Segoe UI", 12), bg="#f8d7da", fg="#721c24").pack(pady=10)
-
-            retry_button = tk.Button(error_frame, text="🔄 Retry",
-                                     command=self.refresh_data, bg="#dc3545", fg="white",
-                                     font=("Segoe UI", 11), relief="flat", padx=20)
-            retry_button.pack(pady=10)
+            self.show_error()
 
     def export_report(self):
         try:
-            df = self.analytics.get_predicted_high_demand_products(30)
+            key, fetch, args = self.query()
+            df = self.cached_query(key, fetch, *args)
             if not df.empty:
                 from report_generator import RestockerReportGenerator
                 report_gen = RestockerReportGenerator()
@@ -341,6 +469,9 @@ class RestockerPage(tk.Frame):
 
         self.sidebar_expand = False
         self.separators = []
+        self.analytics = RestockerAnalytics()
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self._pending_switch = None
 
         self.theme_colors = {
             'bg': '#f0f0f0',
@@ -486,7 +617,16 @@ class RestockerPage(tk.Frame):
         except Exception:
             pass
 
+    def destroy(self):
+        # The click handler is global, so drop it with the page
+        self.unbind_all("<Button-1>")
+        super().destroy()
+
     def logout(self):
+        if self._pending_switch is not None:
+            self.after_cancel(self._pending_switch)
+            self._pending_switch = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.controller.set_current_user(None)
         self.controller.show_frame("LoginPage")
         self.controller.title("LogicMart Analytics System - Login")
@@ -496,20 +636,26 @@ class RestockerPage(tk.Frame):
         if self.current_content:
             self.current_content.destroy()
 
-    def show_low_stock(self):
+    def schedule_switch(self, frame_class, delay=150):
+        # Only the last tab clicked in quick succession gets built
+        if self._pending_switch is not None:
+            self.after_cancel(self._pending_switch)
+        self._pending_switch = self.after(delay, self._switch_to, frame_class)
+
+    def _switch_to(self, frame_class):
+        self._pending_switch = None
         self.clear_content()
-        self.current_content = LowStock(self.content)
+        self.current_content = frame_class(self.content, self.analytics, self.executor)
         self.current_content.pack(fill="both", expand=True)
 
+    def show_low_stock(self):
+        self.schedule_switch(LowStock)
+
     def show_inventory_trends(self):
-        self.clear_content()
-        self.current_content = InventoryTrends(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self.schedule_switch(InventoryTrends)
 
     def show_forecast_demand(self):
-        self.clear_content()
-        self.current_content = ForecastDemand(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self.schedule_switch(ForecastDemand)
 
     def separator(self, parent):
         separator = tk.Frame(parent, height=1, bg="#bdc3c7")
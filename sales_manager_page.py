@@ -5,7 +5,6 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import pandas as pd
 import numpy as np
 from analytics_engine import SalesManagerAnalytics
-from report_generator import SalesManagerReportGenerator
 from tkcalendar import DateEntry
 from datetime import datetime, timedelta
 import seaborn as sns
@@ -13,6 +12,9 @@ import seaborn as sns
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
 
+SIDEBAR_BUTTON_STYLE = dict(bg="#2c3e50", fg="#ecf0f1", activebackground="#34495e", activeforeground="white",
+                            bd=0, font=("Segoe UI", 11), anchor="w", padx=15)
+
 class SalesDataFrame(tk.Frame):
     
     def __init__(self, master, title):
@@ -129,6 +131,9 @@ class SalesDataFrame(tk.Frame):
     def refresh_data(self):
         messagebox.showinfo("Refresh", "Data refreshed!")
 
+    def on_shown(self):
+        pass
+
 
 class SalesTrend(SalesDataFrame):
     def __init__(self, master):
@@ -364,6 +369,7 @@ class SalesTrend(SalesDataFrame):
                     df = ma.get_sales_trend_analysis(days, self.metric_var.get())
                 
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 data_sections = {"Sales Trend Analysis": df}
                 report_gen.generate_sales_report({"sales_trends": df}, 'pdf')
@@ -398,6 +404,7 @@ class SalesTrend(SalesDataFrame):
                     df = ma.get_sales_trend_analysis(days, self.metric_var.get())
                 
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 data_sections = {"Sales Trend Analysis": df}
                 report_gen.generate_sales_report({"sales_trends": df}, 'excel')
@@ -796,6 +803,10 @@ class RealTime(SalesDataFrame):
     def refresh_data(self):
         self.load_data()
 
+    def on_shown(self):
+        # Revisiting the dashboard picks up new sales once its 60s cache expires
+        self.load_data()
+
 class PromotionSales(SalesDataFrame):
     def __init__(self, master):
         self.promotions_data = pd.DataFrame() 
@@ -1023,6 +1034,7 @@ class PromotionSales(SalesDataFrame):
     def export_pdf(self):
         try:
             if hasattr(self, 'df') and not self.df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 report_gen.generate_sales_report({"promotional_comparison": self.df}, 'pdf')
                 messagebox.showinfo("Export Success", "Promotional comparison report exported to PDF successfully!")
@@ -1034,6 +1046,7 @@ class PromotionSales(SalesDataFrame):
     def export_excel(self):
         try:
             if hasattr(self, 'df') and not self.df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 report_gen.generate_sales_report({"promotional_comparison": self.df}, 'excel')
                 messagebox.showinfo("Export Success", "Promotional comparison data exported to Excel successfully!")
@@ -1426,6 +1439,7 @@ class PopularProduct(SalesDataFrame):
             df = self.get_popular_products_data(days, metric, category, limit, start_date, end_date)
             
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 report_gen.generate_sales_report({"popular_products": df}, 'pdf')
                 messagebox.showinfo("Export Success", "Popular products report exported to PDF successfully!")
@@ -1452,6 +1466,7 @@ class PopularProduct(SalesDataFrame):
             df = self.get_popular_products_data(days, metric, category, limit, start_date, end_date)
             
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 report_gen.generate_sales_report({"popular_products": df}, 'excel')
                 messagebox.showinfo("Export Success", "Popular products data exported to Excel successfully!")
@@ -1811,6 +1826,7 @@ class CustomerBuyingBehavior(SalesDataFrame):
             df = self.get_buying_behavior_data(analysis_type, days, start_date, end_date)
             
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 data_sections = {f"Customer Buying Behavior - {analysis_type.replace('_', ' ').title()}": df}
                 report_gen.generate_sales_report({"customer_behavior": df}, 'pdf')
@@ -1836,6 +1852,7 @@ class CustomerBuyingBehavior(SalesDataFrame):
             df = self.get_buying_behavior_data(analysis_type, days, start_date, end_date)
             
             if not df.empty:
+                from report_generator import SalesManagerReportGenerator
                 report_gen = SalesManagerReportGenerator()
                 data_sections = {f"Customer Buying Behavior - {analysis_type.replace('_', ' ').title()}": df}
                 report_gen.generate_sales_report({"customer_behavior": df}, 'excel')
@@ -1856,7 +1873,6 @@ class SManagerPage(tk.Frame):
         self.controller.title("Sales Manager Page")
 
         self.sidebar_expand = False
-        self.separators = []
         
         self.theme_colors = {
             'bg': '#f0f0f0',
@@ -1886,39 +1902,17 @@ class SManagerPage(tk.Frame):
                                        command=self.toggle_sidebar, bd=0, font=("Segoe UI", 14))
         self.toggle_button.pack(pady=10, anchor="w", fill="x")
 
-        self.logout_button = tk.Button(self.sidebar, text="Logout", fg="black", bg="white",
-                                       bd=2, font=("Segoe UI", 13, "bold"), command=self.logout)
-
-        self.sales_trend_button = tk.Button(
-            self.sidebar, text="Sales Trend Analysis", bg="#2c3e50", fg="#ecf0f1", activebackground="#34495e",
-            activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w", padx=15, command=self.show_sales_trend)
-
-        self.customer_buying_button = tk.Button(
-            self.sidebar, text="Customer Buying Behavior", bg="#2c3e50", fg="#ecf0f1", activebackground="#34495e",
-            activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w", padx=15, 
-            command=self.show_customer_buying, wraplength=150, justify="left")
-
-        self.real_time_button = tk.Button(
-            self.sidebar, text="Real Time Sales Dashboard", bg="#2c3e50", fg="#ecf0f1",
-            activebackground="#34495e", activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w", padx=15,
-            command=self.show_real_time, wraplength=150, justify="left")
-
-        self.popular_product_button = tk.Button(
-            self.sidebar, text="Popular Product Data", bg="#2c3e50", fg="#ecf0f1", activebackground="#34495e",
-            activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w",
-            padx=15, command=self.show_popular_product)
-
-        self.promotion_sales_button = tk.Button(
-            self.sidebar, text="Promotion Sales Comparison", bg="#2c3e50", fg="#ecf0f1", activebackground="#34495e",
-            activeforeground="white", bd=0, font=("Segoe UI", 11), anchor="w",
-            padx=15, command=self.show_promotion_sales, wraplength=150, justify="left")
+        # Sidebar contents are built the first time it is expanded
+        self.sidebar_items = None
 
         self.content = tk.Frame(self.container, bg=self.theme_colors['bg'])
         self.content.pack(side="left", fill="both", expand=True)
 
         self.bind_all("<Button-1>", self.click_outside)
 
-        self.current_content = None
+        # Pages are built on first visit and kept for later switches
+        self._pages = {}
+        self._current = None
         
         self.show_welcome()
 
@@ -1966,57 +1960,76 @@ class SManagerPage(tk.Frame):
                                      bg=self.theme_colors['bg'])
         instructions_label.pack(pady=10)
         
-        self.current_content = welcome_frame
+        self._current = welcome_frame
+
+    def build_sidebar(self):
+        self.logout_button = tk.Button(self.sidebar, text="Logout", fg="black", bg="white",
+                                       bd=2, font=("Segoe UI", 13, "bold"), command=self.logout)
+
+        self.sales_trend_button = tk.Button(
+            self.sidebar, text="Sales Trend Analysis", command=self.show_sales_trend, **SIDEBAR_BUTTON_STYLE)
+
+        self.customer_buying_button = tk.Button(
+            self.sidebar, text="Customer Buying Behavior", command=self.show_customer_buying,
+            wraplength=150, justify="left", **SIDEBAR_BUTTON_STYLE)
+
+        self.real_time_button = tk.Button(
+            self.sidebar, text="Real Time Sales Dashboard", command=self.show_real_time,
+            wraplength=150, justify="left", **SIDEBAR_BUTTON_STYLE)
+
+        self.popular_product_button = tk.Button(
+            self.sidebar, text="Popular Product Data", command=self.show_popular_product, **SIDEBAR_BUTTON_STYLE)
+
+        self.promotion_sales_button = tk.Button(
+            self.sidebar, text="Promotion Sales Comparison", command=self.show_promotion_sales,
+            wraplength=150, justify="left", **SIDEBAR_BUTTON_STYLE)
+
+        self.role_header = tk.Label(self.sidebar, text="SALES MANAGER",
+                                    bg="#34495e", fg="#ecf0f1", font=("Segoe UI", 11, "bold"),
+                                    anchor="center", pady=8)
+
+        nav_buttons = [self.sales_trend_button, self.customer_buying_button, self.real_time_button,
+                       self.popular_product_button, self.promotion_sales_button]
+        self.sidebar_items = [(self.role_header, {'fill': 'x', 'pady': (15, 10)})]
+        for i, button in enumerate(nav_buttons):
+            if i > 0:
+                self.sidebar_items.append((self.separator(self.sidebar), {'fill': 'x', 'padx': 10, 'pady': (2, 5)}))
+            self.sidebar_items.append((button, {'fill': 'x', 'pady': (10, 0)}))
 
     def toggle_sidebar(self):
         if self.sidebar_expand:
             self.sidebar.config(width=50)
             self.toggle_button.config(text="☰", font=("Segoe UI", 14), anchor="center", padx=0)
             self.logout_button.pack_forget()
-            self.sales_trend_button.pack_forget()
-            self.customer_buying_button.pack_forget()
-            self.real_time_button.pack_forget()
-            self.popular_product_button.pack_forget()
-            self.promotion_sales_button.pack_forget()
-
-            for sep in self.separators:
-                sep.destroy()
-            self.separators.clear()
+            for widget, _ in self.sidebar_items:
+                widget.pack_forget()
 
         else:
+            if self.sidebar_items is None:
+                self.build_sidebar()
             self.sidebar.config(width=200)
             self.toggle_button.config(text="<", anchor="e", font=("Segoe UI", 14, "bold"), padx=20, )
             self.logout_button.pack(side="bottom", fill="x", pady=(10, 20), padx=20)
-            
-            role_header = tk.Label(self.sidebar, text="SALES MANAGER", 
-                                  bg="#34495e", fg="#ecf0f1", font=("Segoe UI", 11, "bold"),
-                                  anchor="center", pady=8)
-            role_header.pack(fill="x", pady=(15, 10))
-            self.separators.append(role_header)
-            
-            self.sales_trend_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.customer_buying_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.real_time_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.popular_product_button.pack(fill="x", pady=(10, 0))
-            self.separator(self.sidebar)
-            self.promotion_sales_button.pack(fill="x", pady=(10, 0))
+            for widget, options in self.sidebar_items:
+                widget.pack(**options)
         self.sidebar_expand = not self.sidebar_expand
 
     def click_outside(self, event):
+        if not self.sidebar_expand:
+            return
         try:
-            if self.sidebar_expand:
-                x, y = event.x_root, event.y_root
-                sidebar_x = self.sidebar.winfo_rootx()
-                sidebar_w = self.sidebar.winfo_width()
-
-                if x > sidebar_x + sidebar_w:
-                    self.toggle_sidebar()
+            # Compare widget paths so a click needs no geometry queries
+            widget, sidebar = str(event.widget), str(self.sidebar)
+            if widget != sidebar and not widget.startswith(sidebar + "."):
+                self.toggle_sidebar()
         except Exception:
             pass
 
+    def destroy(self):
+        # The click handler is global, so drop it with the page
+        self.unbind_all("<Button-1>")
+        super().destroy()
+
     def logout(self):
         self.controller.set_current_user(None)
         self.controller.show_frame("LoginPage")
@@ -2024,35 +2037,41 @@ class SManagerPage(tk.Frame):
         messagebox.showinfo("Logout", "You have been logged out successfully")
 
     def clear_content(self):
-        if self.current_content:
-            self.current_content.destroy()
+        if self._current is None:
+            return
+        if self._current in self._pages.values():
+            self._current.place_forget()
+        else:
+            self._current.destroy()
+        self._current = None
 
-    def show_sales_trend(self):
+    def _show(self, page_class):
+        page = self._pages.get(page_class)
+        if page is not None and page is self._current:
+            return
         self.clear_content()
-        self.current_content = SalesTrend(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        if page is None:
+            page = self._pages[page_class] = page_class(self.content)
+        else:
+            page.on_shown()
+        # Cached pages are overlaid with place so switching tabs skips a pack pass over content
+        page.place(x=0, y=0, relwidth=1, relheight=1)
+        self._current = page
+
+    def show_sales_trend(self):
+        self._show(SalesTrend)
 
     def show_customer_buying(self):
-        self.clear_content()
-        self.current_content = CustomerBuyingBehavior(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self._show(CustomerBuyingBehavior)
 
     def show_real_time(self):
-        self.clear_content()
-        self.current_content = RealTime(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self._show(RealTime)
 
     def show_popular_product(self):
-        self.clear_content()
-        self.current_content = PopularProduct(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self._show(PopularProduct)
 
     def show_promotion_sales(self):
-        self.clear_content()
-        self.current_content = PromotionSales(self.content)
-        self.current_content.pack(fill="both", expand=True)
+        self._show(PromotionSales)
 
     def separator(self, parent):
-        separator = tk.Frame(parent, height=1, bg="#bdc3c7")
-        separator.pack(fill="x", padx=10, pady=(2, 5))
-        self.separators.append(separator)
\ No newline at end of file
+        return tk.Frame(parent, height=1, bg="#bdc3c7")
\ No newline at end of file
@@ -0,0 +1,35 @@
+import numpy as np
+
+
+def downsample_lttb(x, y, threshold=500):
+    n = len(x)
+    if threshold < 3 or n <= threshold:
+        return x, y
+
+    x_num = np.asarray(x)
+    if np.issubdtype(x_num.dtype, np.datetime64):
+        x_num = x_num.astype('datetime64[ns]').astype(np.int64)
+    x_num = x_num.astype(float)
+    y_num = np.asarray(y, dtype=float)
+
+    # Interior points 1..n-2 split into threshold-2 buckets; first and last points are always kept
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x_num[:n - 1], edges[:-1]) / counts
+    avg_y = np.add.reduceat(y_num[:n - 1], edges[:-1]) / counts
+    next_x = np.append(avg_x[1:], x_num[-1])
+    next_y = np.append(avg_y[1:], y_num[-1])
+
+    selected = np.empty(threshold, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x_num[a] - next_x[i]) * (y_num[lo:hi] - y_num[a])
+                      - (x_num[a] - x_num[lo:hi]) * (next_y[i] - y_num[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return np.asarray(x)[selected], np.asarray(y)[selected]